@@ -88,13 +88,11 @@ def search():
             # Search for courts only (default)
             slots = scrape_all_portals(date, start_time, end_time, locations)
 
-            # Get preferred slot if available
+            # Get preferred slot index if available
             pref_engine = PreferenceEngine()
             preferred = None
             if pref_engine.has_confidence() and slots:
-                preferred_slot = pref_engine.get_preferred_slot(slots)
-                if preferred_slot:
-                    preferred = slots.index(preferred_slot)
+                preferred = pref_engine.get_preferred_index(slots)
 
             response_data['slots'] = slots[:20]  # Top 20
             response_data['total'] = len(slots)
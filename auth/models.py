@@ -3,6 +3,27 @@
 from datetime import datetime
 from database.db import get_db
 
+# Login-attempt statements as shared constants: sqlite3 caches compiled
+# statements per connection keyed on the SQL text, so reusing the exact same
+# string on these per-request queries guarantees cache hits instead of
+# re-parsing the SQL each time.
+_INSERT_ATTEMPT_SQL = '''
+    INSERT INTO login_attempts (email, ip_address, success)
+    VALUES (?, ?, ?)
+'''
+
+_COUNT_FAILED_BY_EMAIL_SQL = '''
+    SELECT COUNT(*) as count FROM login_attempts
+    WHERE email = ? AND success = 0
+    AND timestamp > datetime('now', '-' || ? || ' seconds')
+'''
+
+_COUNT_FAILED_BY_IP_SQL = '''
+    SELECT COUNT(*) as count FROM login_attempts
+    WHERE ip_address = ? AND success = 0
+    AND timestamp > datetime('now', '-' || ? || ' seconds')
+'''
+
 class User:
     """User model."""
 
@@ -28,15 +49,15 @@ class User:
         row = cursor.fetchone()
         if row:
             return User(
-                id=row['id'],
-                email=row['email'],
-                password_hash=row['password_hash'],
-                first_name=row['first_name'],
-                last_name=row['last_name'],
-                created_at=row['created_at'],
-                last_login=row['last_login'],
-                is_active=row['is_active'],
-                email_verified=row['email_verified']
+                id=row.id,
+                email=row.email,
+                password_hash=row.password_hash,
+                first_name=row.first_name,
+                last_name=row.last_name,
+                created_at=row.created_at,
+                last_login=row.last_login,
+                is_active=row.is_active,
+                email_verified=row.email_verified
             )
         return None
 
@@ -49,15 +70,15 @@ class User:
         row = cursor.fetchone()
         if row:
             return User(
-                id=row['id'],
-                email=row['email'],
-                password_hash=row['password_hash'],
-                first_name=row['first_name'],
-                last_name=row['last_name'],
-                created_at=row['created_at'],
-                last_login=row['last_login'],
-                is_active=row['is_active'],
-                email_verified=row['email_verified']
+                id=row.id,
+                email=row.email,
+                password_hash=row.password_hash,
+                first_name=row.first_name,
+                last_name=row.last_name,
+                created_at=row.created_at,
+                last_login=row.last_login,
+                is_active=row.is_active,
+                email_verified=row.email_verified
             )
         return None
 
@@ -132,13 +153,13 @@ class PortalCredentials:
         row = cursor.fetchone()
         if row:
             return PortalCredentials(
-                id=row['id'],
-                user_id=row['user_id'],
-                portal_name=row['portal_name'],
-                username=row['username'],
-                password_encrypted=row['password_encrypted'],
-                created_at=row['created_at'],
-                updated_at=row['updated_at']
+                id=row.id,
+                user_id=row.user_id,
+                portal_name=row.portal_name,
+                username=row.username,
+                password_encrypted=row.password_encrypted,
+                created_at=row.created_at,
+                updated_at=row.updated_at
             )
         return None
 
@@ -150,13 +171,13 @@ class PortalCredentials:
         cursor.execute('SELECT * FROM portal_credentials WHERE user_id = ?', (user_id,))
         rows = cursor.fetchall()
         return [PortalCredentials(
-            id=row['id'],
-            user_id=row['user_id'],
-            portal_name=row['portal_name'],
-            username=row['username'],
-            password_encrypted=row['password_encrypted'],
-            created_at=row['created_at'],
-            updated_at=row['updated_at']
+            id=row.id,
+            user_id=row.user_id,
+            portal_name=row.portal_name,
+            username=row.username,
+            password_encrypted=row.password_encrypted,
+            created_at=row.created_at,
+            updated_at=row.updated_at
         ) for row in rows]
 
     def save(self):
@@ -187,10 +208,7 @@ class LoginAttempt:
         """Log a login attempt."""
         db = get_db()
         cursor = db.cursor()
-        cursor.execute('''
-            INSERT INTO login_attempts (email, ip_address, success)
-            VALUES (?, ?, ?)
-        ''', (email, ip_address, success))
+        cursor.execute(_INSERT_ATTEMPT_SQL, (email, ip_address, success))
         db.commit()
 
     @staticmethod
@@ -198,23 +216,18 @@ class LoginAttempt:
         """Get number of recent failed login attempts."""
         db = get_db()
         cursor = db.cursor()
-        cursor.execute('''
-            SELECT COUNT(*) as count FROM login_attempts
-            WHERE email = ? AND success = 0
-            AND datetime(timestamp) > datetime('now', '-' || ? || ' seconds')
-        ''', (email, window_seconds))
+        # Compare the raw timestamp column (stored as 'YYYY-MM-DD HH:MM:SS')
+        # so SQLite can use the composite index - wrapping it in datetime()
+        # would force a full scan.
+        cursor.execute(_COUNT_FAILED_BY_EMAIL_SQL, (email, window_seconds))
         row = cursor.fetchone()
-        return row['count'] if row else 0
+        return row.count if row else 0
 
     @staticmethod
     def get_recent_failed_attempts_by_ip(ip_address, window_seconds):
         """Get number of recent failed login attempts by IP."""
         db = get_db()
         cursor = db.cursor()
-        cursor.execute('''
-            SELECT COUNT(*) as count FROM login_attempts
-            WHERE ip_address = ? AND success = 0
-            AND datetime(timestamp) > datetime('now', '-' || ? || ' seconds')
-        ''', (ip_address, window_seconds))
+        cursor.execute(_COUNT_FAILED_BY_IP_SQL, (ip_address, window_seconds))
         row = cursor.fetchone()
-        return row['count'] if row else 0
+        return row.count if row else 0
@@ -37,20 +37,24 @@ def validate_password(password):
 
     return True, "Password is valid"
 
+# Fernet instance built once per process - the constructor base64-decodes the
+# key and derives the signing/encryption halves, so don't repeat it per call.
+_fernet = None
+
+def _get_fernet():
+    """Return the shared Fernet instance, building it on first use."""
+    global _fernet
+    if _fernet is None:
+        if not config.ENCRYPTION_KEY:
+            raise ValueError("ENCRYPTION_KEY not set in environment")
+        key = config.ENCRYPTION_KEY.encode() if isinstance(config.ENCRYPTION_KEY, str) else config.ENCRYPTION_KEY
+        _fernet = Fernet(key)
+    return _fernet
+
 def encrypt_credential(plaintext):
     """Encrypt portal credentials."""
-    if not config.ENCRYPTION_KEY:
-        raise ValueError("ENCRYPTION_KEY not set in environment")
-
-    key = config.ENCRYPTION_KEY.encode() if isinstance(config.ENCRYPTION_KEY, str) else config.ENCRYPTION_KEY
-    f = Fernet(key)
-    return f.encrypt(plaintext.encode()).decode()
+    return _get_fernet().encrypt(plaintext.encode()).decode()
 
 def decrypt_credential(encrypted):
     """Decrypt portal credentials."""
-    if not config.ENCRYPTION_KEY:
-        raise ValueError("ENCRYPTION_KEY not set in environment")
-
-    key = config.ENCRYPTION_KEY.encode() if isinstance(config.ENCRYPTION_KEY, str) else config.ENCRYPTION_KEY
-    f = Fernet(key)
-    return f.decrypt(encrypted.encode()).decode()
+    return _get_fernet().decrypt(encrypted.encode()).decode()
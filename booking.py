@@ -7,6 +7,7 @@ import time
 import sys
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -59,6 +60,11 @@ class DasSpielBooker:
 
     def __init__(self):
         self.session = requests.Session()
+        # Pooled adapter so login, calendar and booking calls against the
+        # same host reuse one TCP/TLS connection instead of re-handshaking
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self.session.mount('https://', adapter)
         self.credentials = self._load_credentials()
         self.csrf_token = None
 
@@ -1,6 +1,8 @@
 """Conversational interface engine for Tennis Booking app."""
 
 import re
+import threading
+import time
 from datetime import datetime
 from timeframe_parser import TimeframeParser
 from scrapers_v2 import scrape_all_portals
@@ -8,13 +10,153 @@ from trainer_finder import find_trainers
 from booking import book_court
 from preference_engine import PreferenceEngine
 
+# Precompiled pattern covering "option 1", "number 2", "slot 3", "#4" and bare
+# digits - compiled once at import instead of once per message.
+_SLOT_RE = re.compile(r'(?:option|number|slot|#)\s*(\d+)|^\s*(\d+)\s*$', re.IGNORECASE)
+
+# Ordinal words mapped to 0-indexed slot positions ('first'/'top' checked first).
+_SLOT_WORDS = {'first': 0, 'top': 0, 'second': 1, 'third': 2}
+
+# Tokenizer for the one-time message tokenization in parse_intent; strips
+# punctuation so "first." still yields the token "first".
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+# Intent keywords, hoisted to module level so they are built once instead of on
+# every parse_intent call. Single words are matched against the tokenized
+# message via set intersection; multi-word phrases fall back to substring checks.
+GREETING_WORDS = frozenset({'hi', 'hello', 'hey', 'start'})
+SEARCH_WORDS = frozenset({'find', 'search', 'show', 'available', 'need'})
+SEARCH_PHRASES = (b'look for', b'i want')
+BOOK_WORDS = frozenset({'book', 'reserve', 'take'})
+BOOK_PHRASES = (b"i'll take",)
+HISTORY_WORDS = frozenset({'history', 'bookings', 'booked'})
+HISTORY_PHRASES = (b'my bookings', b'what did i')
+HELP_WORDS = frozenset({'help'})
+HELP_PHRASES = (b'what can you', b'how do')
+THANKS_WORDS = frozenset({'thanks', 'great', 'perfect'})
+THANKS_PHRASES = (b'thank you',)
+CANCEL_WORDS = frozenset({'cancel', 'nevermind', 'stop'})
+CANCEL_PHRASES = (b'never mind',)
+
+# Process-wide TTL cache for portal/trainer search results. Repeat queries for
+# the same date/time window within the TTL skip the scrape entirely, which also
+# shields the portals from burst traffic.
+_SEARCH_CACHE_TTL = 90  # seconds
+_SEARCH_CACHE_MAXSIZE = 256
+_search_cache = {}
+_search_cache_lock = threading.Lock()
+
+
+def _search_cache_get(key):
+    """Return a cached result or None if missing/expired."""
+    with _search_cache_lock:
+        entry = _search_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del _search_cache[key]
+            return None
+        return value
+
+
+def _search_cache_put(key, value):
+    """Store a search result, evicting stale/oldest entries when full."""
+    with _search_cache_lock:
+        if len(_search_cache) >= _SEARCH_CACHE_MAXSIZE:
+            now = time.monotonic()
+            expired = [k for k, (exp, _) in _search_cache.items() if exp < now]
+            for k in expired:
+                del _search_cache[k]
+            if len(_search_cache) >= _SEARCH_CACHE_MAXSIZE:
+                oldest = min(_search_cache, key=lambda k: _search_cache[k][0])
+                del _search_cache[oldest]
+        _search_cache[key] = (time.monotonic() + _SEARCH_CACHE_TTL, value)
+
+
+# Static replies, built once at import instead of re-assembled per call
+_GREETING_REPLY = ("Hi! I'm your tennis booking assistant. 🎾\n\n"
+                   "I can help you:\n"
+                   "• Find available tennis courts at Arsenal and Post SV\n"
+                   "• Search for trainers at Arsenal\n"
+                   "• Book courts and trainer sessions\n\n"
+                   "Just tell me what you'd like to do! For example:\n"
+                   "- 'Find a court tomorrow at 6pm'\n"
+                   "- 'I need a trainer next Monday morning'\n"
+                   "- 'Show available courts this weekend'")
+
+_HELP_REPLY = ("Here's what you can ask me:\n\n"
+               "**Search for courts:**\n"
+               "• 'Find a court tomorrow at 18:00'\n"
+               "• 'Show available courts next Monday evening'\n"
+               "• 'I want to play tennis this Friday 6pm'\n\n"
+               "**Search for trainers:**\n"
+               "• 'Find a trainer tomorrow morning'\n"
+               "• 'I need trainer Tobias on Friday'\n\n"
+               "**Book:**\n"
+               "• 'Book option 1'\n"
+               "• 'I'll take the first one'\n"
+               "• 'Reserve number 2'\n\n"
+               "Just ask naturally and I'll understand! 🎾")
+
+_UNKNOWN_REPLY = ("I'm not sure what you mean. Try asking me to:\n"
+                  "• Find a court (e.g., 'tomorrow at 6pm')\n"
+                  "• Find a trainer (e.g., 'next Monday morning')\n"
+                  "• Book a court (e.g., 'book option 1')\n\n"
+                  "Or just say 'help' to see examples!")
+
+_HISTORY_REPLY = ("Looking at your booking history...\n\n"
+                  "Booking history feature coming soon! For now, you can "
+                  "search for courts and book them directly.")
+
+_THANKS_REPLY = "You're welcome! Anything else I can help you with? 🎾"
+
+_CANCEL_REPLY = "No problem! Let me know if you need anything else."
+
+# Known trainers as precomputed (needle, display name) pairs - avoids calling
+# str.title() on every match.
+TRAINERS = (
+    ('tobias', 'Tobias'),
+    ('rossen', 'Rossen'),
+    ('tobias w', 'Tobias W'),
+    ('tobias w.', 'Tobias W.'),
+)
+
 
 class ChatEngine:
     """Handles conversational interactions for tennis booking."""
 
+    # Shared helper instances - a ChatEngine is created per chat request, but
+    # the parser tables and the preference JSON only need loading once per
+    # process. Built lazily under a lock for threaded Flask workers.
+    _shared_timeframe_parser = None
+    _shared_pref_engine = None
+    _init_lock = threading.Lock()
+
     def __init__(self):
-        self.timeframe_parser = TimeframeParser()
-        self.pref_engine = PreferenceEngine()
+        cls = ChatEngine
+        if cls._shared_timeframe_parser is None or cls._shared_pref_engine is None:
+            with cls._init_lock:
+                if cls._shared_timeframe_parser is None:
+                    cls._shared_timeframe_parser = TimeframeParser()
+                if cls._shared_pref_engine is None:
+                    cls._shared_pref_engine = PreferenceEngine()
+        self.timeframe_parser = cls._shared_timeframe_parser
+        self.pref_engine = cls._shared_pref_engine
+
+        # Intent dispatch table - one dict lookup per turn instead of walking
+        # an if/elif chain of string comparisons. All handlers share the
+        # (message, entities, context) signature.
+        self._dispatch = {
+            'greeting': self._respond_greeting,
+            'search_court': self._respond_search_court,
+            'search_trainer': self._respond_search_trainer,
+            'book': self._respond_book,
+            'history': self._respond_history,
+            'help': self._respond_help,
+            'thanks': self._respond_thanks,
+            'cancel': self._respond_cancel,
+        }
 
     def parse_intent(self, message, context):
         """Parse user message to determine intent and extract entities.
@@ -28,45 +170,54 @@ class ChatEngine:
         """
         msg_lower = message.lower().strip()
 
+        # Tokenize once; single-word keyword checks become hashed set
+        # intersections instead of repeated substring scans. The same token
+        # set is reused by all _extract_* helpers below.
+        tokens = frozenset(_TOKEN_RE.findall(msg_lower))
+
+        # ASCII-folded bytes buffer for phrase checks - all intent phrases are
+        # ASCII, and bytes.find goes straight to C memmem
+        buf = msg_lower.encode('ascii', 'ignore')
+
         # Detect intent
         intent = 'unknown'
 
         # Greeting
-        if any(word in msg_lower for word in ['hi', 'hello', 'hey', 'start']):
+        if tokens & GREETING_WORDS:
             intent = 'greeting'
 
         # Search intents
-        elif any(word in msg_lower for word in ['find', 'search', 'show', 'available', 'look for', 'i want', 'need']):
+        elif tokens & SEARCH_WORDS or any(buf.find(p) != -1 for p in SEARCH_PHRASES):
             if 'trainer' in msg_lower:
                 intent = 'search_trainer'
             else:
                 intent = 'search_court'
 
         # Booking intents
-        elif any(word in msg_lower for word in ['book', 'reserve', 'take', "i'll take"]):
+        elif tokens & BOOK_WORDS or any(buf.find(p) != -1 for p in BOOK_PHRASES):
             intent = 'book'
 
         # History/Info
-        elif any(word in msg_lower for word in ['history', 'bookings', 'booked', 'my bookings', 'what did i']):
+        elif tokens & HISTORY_WORDS or any(buf.find(p) != -1 for p in HISTORY_PHRASES):
             intent = 'history'
 
         # Help
-        elif any(word in msg_lower for word in ['help', 'what can you', 'how do']):
+        elif tokens & HELP_WORDS or any(buf.find(p) != -1 for p in HELP_PHRASES):
             intent = 'help'
 
         # Thanks
-        elif any(word in msg_lower for word in ['thanks', 'thank you', 'great', 'perfect']):
+        elif tokens & THANKS_WORDS or any(buf.find(p) != -1 for p in THANKS_PHRASES):
             intent = 'thanks'
 
         # Cancel
-        elif any(word in msg_lower for word in ['cancel', 'never mind', 'nevermind', 'stop']):
+        elif tokens & CANCEL_WORDS or any(buf.find(p) != -1 for p in CANCEL_PHRASES):
             intent = 'cancel'
 
         # Extract entities
         entities = {
-            'trainer_name': self._extract_trainer_name(msg_lower),
-            'location': self._extract_location(msg_lower),
-            'slot_reference': self._extract_slot_reference(msg_lower, context)
+            'trainer_name': self._extract_trainer_name(msg_lower, tokens),
+            'location': self._extract_location(msg_lower, tokens),
+            'slot_reference': self._extract_slot_reference(msg_lower, context, tokens)
         }
 
         # Extract date/time using existing parser if relevant
@@ -83,21 +234,23 @@ class ChatEngine:
 
         return intent, entities
 
-    def _extract_trainer_name(self, message):
+    def _extract_trainer_name(self, message, tokens):
         """Extract trainer name from message."""
-        trainers = ['tobias', 'rossen', 'tobias w', 'tobias w.']
-        for trainer in trainers:
-            if trainer in message:
-                return trainer.title()
+        for needle, name in TRAINERS:
+            # Single-word needles hit the token set; phrases fall back to
+            # substring search
+            matched = needle in message if ' ' in needle else needle in tokens
+            if matched:
+                return name
         return None
 
-    def _extract_location(self, message):
+    def _extract_location(self, message, tokens):
         """Extract location preference from message."""
         locations = {'arsenal': False, 'postsv': False}
 
-        if 'arsenal' in message or 'das spiel' in message:
+        if 'arsenal' in tokens or 'das spiel' in message:
             locations['arsenal'] = True
-        if 'post sv' in message or 'postsv' in message:
+        if 'postsv' in tokens or 'post sv' in message:
             locations['postsv'] = True
 
         # Default: both if none specified
@@ -107,29 +260,18 @@ class ChatEngine:
 
         return locations
 
-    def _extract_slot_reference(self, message, context):
+    def _extract_slot_reference(self, message, context, tokens):
         """Extract reference to a slot from previous results."""
         # Look for patterns like "option 1", "first one", "number 2", etc.
-        patterns = [
-            r'option\s+(\d+)',
-            r'number\s+(\d+)',
-            r'slot\s+(\d+)',
-            r'#(\d+)',
-            r'^(\d+)$'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, message)
-            if match:
-                return int(match.group(1)) - 1  # Convert to 0-indexed
-
-        # Handle words
-        if 'first' in message or 'top' in message:
-            return 0
-        elif 'second' in message:
-            return 1
-        elif 'third' in message:
-            return 2
+        match = _SLOT_RE.search(message)
+        if match:
+            number = match.group(1) or match.group(2)
+            return int(number) - 1  # Convert to 0-indexed
+
+        # Handle words - O(1) token lookups instead of substring scans
+        for word, index in _SLOT_WORDS.items():
+            if word in tokens:
+                return index
 
         return None
 
@@ -145,87 +287,68 @@ class ChatEngine:
         """
         intent, entities = self.parse_intent(message, context)
 
-        response = {
-            'reply': '',
+        # Route to the appropriate handler via the dispatch table
+        handler = self._dispatch.get(intent, self._respond_unknown)
+        return handler(message, entities, context)
+
+    def _simple_response(self, reply, suggestions, context):
+        """Build a plain reply response without touching the context.
+
+        Copy-on-write: hands back the original context reference - only
+        handlers that actually mutate state make copies.
+        """
+        return {
+            'reply': reply,
             'action': None,
             'results': [],
-            'suggestions': [],
-            'context': context.copy()
+            'suggestions': suggestions,
+            'context': context
         }
 
-        # Route to appropriate handler
-        if intent == 'greeting':
-            response['reply'] = self._handle_greeting(context)
-            response['suggestions'] = ['Find a court', 'Find a trainer', 'Show my bookings']
-
-        elif intent == 'search_court':
-            return self._handle_search_court(entities, context)
-
-        elif intent == 'search_trainer':
-            return self._handle_search_trainer(entities, context)
-
-        elif intent == 'book':
-            return self._handle_booking(entities, context)
-
-        elif intent == 'history':
-            response['reply'] = "Looking at your booking history...\n\nBooking history feature coming soon! For now, you can search for courts and book them directly."
-            response['suggestions'] = ['Find a court', 'Find a trainer']
-
-        elif intent == 'help':
-            response['reply'] = self._handle_help()
-            response['suggestions'] = ['Find court tomorrow 6pm', 'Show trainers', 'Find a court']
-
-        elif intent == 'thanks':
-            response['reply'] = "You're welcome! Anything else I can help you with? 🎾"
-            response['suggestions'] = ['Find another court', 'Show my bookings']
-
-        elif intent == 'cancel':
-            response['reply'] = "No problem! Let me know if you need anything else."
-            response['context']['state'] = 'IDLE'
-            response['context']['last_results'] = []
-            response['suggestions'] = ['Find a court', 'Find a trainer']
-
-        else:
-            response['reply'] = self._handle_unknown(message, context)
-            response['suggestions'] = ['Find court tomorrow 6pm', 'Find trainer', 'Help']
-
-        return response
-
-    def _handle_greeting(self, context):
-        """Handle greeting messages."""
-        return ("Hi! I'm your tennis booking assistant. 🎾\n\n"
-                "I can help you:\n"
-                "• Find available tennis courts at Arsenal and Post SV\n"
-                "• Search for trainers at Arsenal\n"
-                "• Book courts and trainer sessions\n\n"
-                "Just tell me what you'd like to do! For example:\n"
-                "- 'Find a court tomorrow at 6pm'\n"
-                "- 'I need a trainer next Monday morning'\n"
-                "- 'Show available courts this weekend'")
-
-    def _handle_help(self):
-        """Handle help requests."""
-        return ("Here's what you can ask me:\n\n"
-                "**Search for courts:**\n"
-                "• 'Find a court tomorrow at 18:00'\n"
-                "• 'Show available courts next Monday evening'\n"
-                "• 'I want to play tennis this Friday 6pm'\n\n"
-                "**Search for trainers:**\n"
-                "• 'Find a trainer tomorrow morning'\n"
-                "• 'I need trainer Tobias on Friday'\n\n"
-                "**Book:**\n"
-                "• 'Book option 1'\n"
-                "• 'I'll take the first one'\n"
-                "• 'Reserve number 2'\n\n"
-                "Just ask naturally and I'll understand! 🎾")
-
-    def _handle_unknown(self, message, context):
-        """Handle unknown intents."""
-        return ("I'm not sure what you mean. Try asking me to:\n"
-                "• Find a court (e.g., 'tomorrow at 6pm')\n"
-                "• Find a trainer (e.g., 'next Monday morning')\n"
-                "• Book a court (e.g., 'book option 1')\n\n"
-                "Or just say 'help' to see examples!")
+    def _respond_greeting(self, message, entities, context):
+        return self._simple_response(
+            _GREETING_REPLY,
+            ['Find a court', 'Find a trainer', 'Show my bookings'],
+            context)
+
+    def _respond_search_court(self, message, entities, context):
+        return self._handle_search_court(entities, context)
+
+    def _respond_search_trainer(self, message, entities, context):
+        return self._handle_search_trainer(entities, context)
+
+    def _respond_book(self, message, entities, context):
+        return self._handle_booking(entities, context)
+
+    def _respond_history(self, message, entities, context):
+        return self._simple_response(
+            _HISTORY_REPLY,
+            ['Find a court', 'Find a trainer'],
+            context)
+
+    def _respond_help(self, message, entities, context):
+        return self._simple_response(
+            _HELP_REPLY,
+            ['Find court tomorrow 6pm', 'Show trainers', 'Find a court'],
+            context)
+
+    def _respond_thanks(self, message, entities, context):
+        return self._simple_response(
+            _THANKS_REPLY,
+            ['Find another court', 'Show my bookings'],
+            context)
+
+    def _respond_cancel(self, message, entities, context):
+        return self._simple_response(
+            _CANCEL_REPLY,
+            ['Find a court', 'Find a trainer'],
+            {**context, 'state': 'IDLE', 'last_results': []})
+
+    def _respond_unknown(self, message, entities, context):
+        return self._simple_response(
+            _UNKNOWN_REPLY,
+            ['Find court tomorrow 6pm', 'Find trainer', 'Help'],
+            context)
 
     def _handle_search_court(self, entities, context):
         """Handle court search requests."""
@@ -248,19 +371,23 @@ class ChatEngine:
                 'context': context
             }
 
-        # Search for courts
+        # Search for courts (cached briefly so repeat queries skip the scrape)
         try:
-            slots = scrape_all_portals(date, start_time, end_time, locations)
-
-            # Get preferred slot if available
+            cache_key = ('court', date.toordinal(), start_time, end_time,
+                         tuple(sorted(locations.items())))
+            slots = _search_cache_get(cache_key)
+            if slots is None:
+                slots = scrape_all_portals(date, start_time, end_time, locations)
+                _search_cache_put(cache_key, slots)
+
+            # Get preferred slot index if available
             preferred_idx = None
             if self.pref_engine.has_confidence() and slots:
-                preferred_slot = self.pref_engine.get_preferred_slot(slots)
-                if preferred_slot:
-                    try:
-                        preferred_idx = slots.index(preferred_slot)
-                    except ValueError:
-                        preferred_idx = None
+                preferred_idx = self.pref_engine.get_preferred_index(slots)
+
+            # Slice once: top 20 stored/returned, top 3 displayed
+            top20 = slots[:20]
+            top3 = top20[:3]
 
             # Format response
             if not slots:
@@ -270,29 +397,33 @@ class ChatEngine:
                 suggestions = ['Different time', 'Tomorrow instead', 'This weekend']
             else:
                 day_str = date.strftime('%A, %B %d')
-                reply = f"Great! I found **{len(slots)} available courts** for {day_str}.\n\n"
+
+                # Build the reply via list-append + join (O(N), no repeated
+                # string reallocation)
+                buf = [f"Great! I found **{len(slots)} available courts** for {day_str}.\n\n"]
 
                 # Show top 3 results
-                for i, slot in enumerate(slots[:3]):
+                for i, slot in enumerate(top3):
                     prefix = "⭐ " if i == preferred_idx else f"{i+1}. "
                     venue = slot.get('venue', 'Unknown')
                     court = slot.get('court_name', 'Court')
-                    time = slot.get('time', '')
+                    time_str = slot.get('time', '')
                     price = slot.get('price', '')
 
-                    reply += f"{prefix}**{court}** at {venue}\n"
-                    reply += f"   {day_str} at {time}"
+                    buf.append(f"{prefix}**{court}** at {venue}\n")
+                    buf.append(f"   {day_str} at {time_str}")
                     if price:
-                        reply += f" (€{price})"
-                    reply += "\n\n"
+                        buf.append(f" (€{price})")
+                    buf.append("\n\n")
 
                 if len(slots) > 3:
-                    reply += f"_...and {len(slots) - 3} more options_\n\n"
+                    buf.append(f"_...and {len(slots) - 3} more options_\n\n")
 
                 if preferred_idx is not None and preferred_idx < 3:
-                    reply += "⭐ = Recommended based on your preferences\n\n"
+                    buf.append("⭐ = Recommended based on your preferences\n\n")
 
-                reply += "Which one would you like to book?"
+                buf.append("Which one would you like to book?")
+                reply = "".join(buf)
                 suggestions = ['Book option 1', 'Book option 2', 'Show more', 'Different time']
 
             # Update context
@@ -305,12 +436,12 @@ class ChatEngine:
                 'end_time': end_time,
                 'locations': locations
             }
-            new_context['last_results'] = slots[:20]  # Store top 20
+            new_context['last_results'] = top20  # Store top 20
 
             return {
                 'reply': reply,
                 'action': 'search_results',
-                'results': slots[:20],
+                'results': top20,
                 'suggestions': suggestions,
                 'context': new_context
             }
@@ -345,9 +476,17 @@ class ChatEngine:
                 'context': context
             }
 
-        # Search for trainers
+        # Search for trainers (cached briefly, same as court searches)
         try:
-            trainers = find_trainers(date, start_time, end_time, trainer_name)
+            cache_key = ('trainer', date.toordinal(), start_time, end_time, trainer_name)
+            trainers = _search_cache_get(cache_key)
+            if trainers is None:
+                trainers = find_trainers(date, start_time, end_time, trainer_name)
+                _search_cache_put(cache_key, trainers)
+
+            # Slice once: top 20 stored/returned, top 3 displayed
+            top20 = trainers[:20]
+            top3 = top20[:3]
 
             # Format response
             if not trainers:
@@ -357,28 +496,31 @@ class ChatEngine:
                 suggestions = ['Different time', 'Find courts instead']
             else:
                 day_str = date.strftime('%A, %B %d')
+
+                # Build the reply via list-append + join, same as court search
                 if trainer_name:
-                    reply = f"Good news! I found **{len(trainers)} sessions** with {trainer_name}:\n\n"
+                    buf = [f"Good news! I found **{len(trainers)} sessions** with {trainer_name}:\n\n"]
                 else:
-                    reply = f"Great! I found **{len(trainers)} available trainer sessions** for {day_str}:\n\n"
+                    buf = [f"Great! I found **{len(trainers)} available trainer sessions** for {day_str}:\n\n"]
 
                 # Show top 3 results
-                for i, trainer in enumerate(trainers[:3]):
+                for i, trainer in enumerate(top3):
                     name = trainer.get('trainer_name', 'Trainer')
                     time_start = trainer.get('time_start', '')
                     time_end = trainer.get('time_end', '')
                     price = trainer.get('price', '')
 
-                    reply += f"{i+1}. **{name}**\n"
-                    reply += f"   {day_str}, {time_start}-{time_end}"
+                    buf.append(f"{i+1}. **{name}**\n")
+                    buf.append(f"   {day_str}, {time_start}-{time_end}")
                     if price:
-                        reply += f" (€{price})"
-                    reply += "\n\n"
+                        buf.append(f" (€{price})")
+                    buf.append("\n\n")
 
                 if len(trainers) > 3:
-                    reply += f"_...and {len(trainers) - 3} more sessions_\n\n"
+                    buf.append(f"_...and {len(trainers) - 3} more sessions_\n\n")
 
-                reply += "Which time works for you?"
+                buf.append("Which time works for you?")
+                reply = "".join(buf)
                 suggestions = ['Book option 1', 'Book option 2', 'Show more']
 
             # Update context
@@ -391,12 +533,12 @@ class ChatEngine:
                 'end_time': end_time,
                 'trainer_name': trainer_name
             }
-            new_context['last_results'] = trainers[:20]
+            new_context['last_results'] = top20
 
             return {
                 'reply': reply,
                 'action': 'search_results',
-                'results': trainers[:20],
+                'results': top20,
                 'suggestions': suggestions,
                 'context': new_context
             }
@@ -4,7 +4,15 @@ import os
 from datetime import timedelta
 from dotenv import load_dotenv
 
-load_dotenv()
+# Load the .env file only once per process, even if this module is reloaded
+if not os.environ.get('_DOTENV_LOADED'):
+    load_dotenv()
+    os.environ['_DOTENV_LOADED'] = '1'
+
+
+def _env_bool(name, default=False):
+    """Parse a boolean environment variable, accepting common truthy spellings."""
+    return os.getenv(name, str(default)).lower() in ('1', 'true', 'yes', 'on')
 
 # Booking portal URLs
 PORTALS = {
@@ -19,7 +27,8 @@ PORTALS = {
 }
 
 # User preferences file (deprecated, kept for backward compatibility)
-PREFERENCES_FILE = "user_preferences.json"
+# JSON Lines: one selection per line, appended in place
+PREFERENCES_FILE = "user_preferences.jsonl"
 
 # Result limits
 MAX_RESULTS = 20
@@ -39,11 +48,15 @@ DATABASE_PATH = DATABASE_URL.replace('sqlite:///', '')
 ENCRYPTION_KEY = os.getenv('ENCRYPTION_KEY', '')
 
 # Session configuration
-SESSION_COOKIE_SECURE = os.getenv('SESSION_COOKIE_SECURE', 'False') == 'True'
-SESSION_COOKIE_HTTPONLY = os.getenv('SESSION_COOKIE_HTTPONLY', 'True') == 'True'
+SESSION_COOKIE_SECURE = _env_bool('SESSION_COOKIE_SECURE', False)
+SESSION_COOKIE_HTTPONLY = _env_bool('SESSION_COOKIE_HTTPONLY', True)
 SESSION_COOKIE_SAMESITE = os.getenv('SESSION_COOKIE_SAMESITE', 'Lax')
 PERMANENT_SESSION_LIFETIME = timedelta(days=int(os.getenv('PERMANENT_SESSION_LIFETIME_DAYS', '7')))
 
+# Maximum concurrent outbound scraper requests - keeps the portal fan-out from
+# triggering 429s/connection resets on the booking sites
+MAX_CONCURRENCY = int(os.getenv('TB_MAX_CONCURRENCY', '8'))
+
 # Rate limiting
 MAX_LOGIN_ATTEMPTS = int(os.getenv('MAX_LOGIN_ATTEMPTS', '5'))
 LOGIN_RATE_LIMIT_WINDOW = int(os.getenv('LOGIN_RATE_LIMIT_WINDOW', '900'))  # 15 minutes in seconds
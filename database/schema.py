@@ -0,0 +1,48 @@
+"""Shared database schema - single source of truth for all tables and indexes.
+
+Used by both database.db.init_db and the standalone create_db.py script so
+the two cannot drift apart. The whole DDL runs through one executescript()
+call instead of eight separate cursor.execute round-trips.
+"""
+
+SCHEMA_SQL = '''
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email VARCHAR(255) UNIQUE NOT NULL,
+    password_hash VARCHAR(255) NOT NULL,
+    first_name VARCHAR(100),
+    last_name VARCHAR(100),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_login TIMESTAMP,
+    is_active BOOLEAN DEFAULT 1,
+    email_verified BOOLEAN DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS portal_credentials (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    portal_name VARCHAR(50) NOT NULL,
+    username VARCHAR(255) NOT NULL,
+    password_encrypted TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+    UNIQUE(user_id, portal_name)
+);
+
+CREATE TABLE IF NOT EXISTS login_attempts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email VARCHAR(255),
+    ip_address VARCHAR(50),
+    success BOOLEAN,
+    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
+CREATE INDEX IF NOT EXISTS idx_portal_credentials_user_id ON portal_credentials(user_id);
+-- Composite covering indexes for the rate-limit queries
+-- ("count WHERE email/ip = ? AND success = 0 AND timestamp > ?"):
+-- one range scan answers the COUNT without touching the table heap.
+CREATE INDEX IF NOT EXISTS idx_login_attempts_email_ts ON login_attempts(email, timestamp DESC, success);
+CREATE INDEX IF NOT EXISTS idx_login_attempts_ip_ts ON login_attempts(ip_address, timestamp DESC, success);
+'''
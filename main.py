@@ -4,8 +4,11 @@ Tennis Court Booking Finder - CLI Application
 Checks availability across multiple booking portals in Vienna.
 """
 
+import heapq
+import io
 import sys
 from datetime import datetime
+from operator import itemgetter
 from timeframe_parser import TimeframeParser
 from scrapers_v2 import scrape_all_portals
 from preference_engine import PreferenceEngine
@@ -13,45 +16,65 @@ from config import MAX_RESULTS
 
 
 def display_results(slots, preferred_slot=None):
-    """Display available slots in a formatted table."""
+    """Display available slots in a formatted table.
+
+    Returns the displayed slots in display order, so selection prompts can
+    index into exactly what the user saw.
+    """
     if not slots:
         print("\nNo available slots found for the specified timeframe.")
-        return
+        return []
 
-    print(f"\n{'='*80}")
-    print(f"Found {len(slots)} available slot(s)")
-    print(f"{'='*80}\n")
+    # Build the whole listing in memory and write it in one go - one
+    # syscall instead of ~6 per slot on an unbuffered TTY
+    buf = io.StringIO()
+    buf.write(f"\n{'='*80}\n")
+    buf.write(f"Found {len(slots)} available slot(s)\n")
+    buf.write(f"{'='*80}\n\n")
 
-    # Sort by datetime
-    slots.sort(key=lambda x: (x.get('date', ''), x.get('time', '')))
+    # Earliest MAX_RESULTS by datetime - O(N log K) instead of sorting
+    # the whole list just to slice off the top. itemgetter runs in C; the
+    # scrapers always set date and time on every slot.
+    top = heapq.nsmallest(MAX_RESULTS, slots, key=itemgetter('date', 'time'))
 
-    for i, slot in enumerate(slots[:MAX_RESULTS], 1):
-        is_preferred = preferred_slot and slot == preferred_slot
+    for i, slot in enumerate(top, 1):
+        # Identity compare: the preferred slot is one of the dicts in this
+        # list, so no per-row dict equality check is needed
+        is_preferred = preferred_slot is slot
 
         prefix = ">>> PREFERRED >>> " if is_preferred else ""
 
-        print(f"{prefix}[{i}] {slot.get('venue', 'Unknown Venue')}")
-        print(f"    Date: {slot.get('date', 'N/A')} ({slot.get('day_of_week', 'N/A')})")
-        print(f"    Time: {slot.get('time', 'N/A')}")
+        buf.write(f"{prefix}[{i}] {slot.get('venue', 'Unknown Venue')}\n")
+        buf.write(f"    Date: {slot.get('date', 'N/A')} ({slot.get('day_of_week', 'N/A')})\n")
+        buf.write(f"    Time: {slot.get('time', 'N/A')}\n")
 
-        if slot.get('court_name'):
-            print(f"    Court: {slot['court_name']}")
-        elif slot.get('court_type'):
-            print(f"    Court: {slot['court_type']}")
+        # Each optional field is looked up once, not once to test and
+        # once to print
+        court = slot.get('court_name') or slot.get('court_type')
+        if court:
+            buf.write(f"    Court: {court}\n")
 
-        if slot.get('price'):
-            print(f"    Price: {slot['price']}")
+        price = slot.get('price')
+        if price:
+            buf.write(f"    Price: {price}\n")
 
-        if slot.get('location'):
-            print(f"    Location: {slot['location']}")
+        location = slot.get('location')
+        if location:
+            buf.write(f"    Location: {location}\n")
 
-        if slot.get('indoor_outdoor'):
-            print(f"    Type: {slot['indoor_outdoor']}")
+        indoor_outdoor = slot.get('indoor_outdoor')
+        if indoor_outdoor:
+            buf.write(f"    Type: {indoor_outdoor}\n")
 
-        print()
+        buf.write('\n')
 
     if len(slots) > MAX_RESULTS:
-        print(f"(Showing top {MAX_RESULTS} of {len(slots)} results)")
+        buf.write(f"(Showing top {MAX_RESULTS} of {len(slots)} results)\n")
+
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+
+    return top
 
 
 def prompt_user_selection(slots):
@@ -150,10 +173,10 @@ def main():
             print("\n" + pref_engine.get_preference_summary())
 
     # Display results
-    display_results(slots, preferred_slot)
+    displayed_slots = display_results(slots, preferred_slot)
 
-    # Prompt for user selection and booking
-    selected_slot, should_book = prompt_user_selection(slots)
+    # Prompt for user selection and booking against the displayed order
+    selected_slot, should_book = prompt_user_selection(displayed_slots)
 
     if selected_slot:
         # Log selection for preference learning
@@ -1,11 +1,29 @@
 """Preference learning engine that learns from user selections."""
 
 import json
+import mmap
 import os
+import re
 from datetime import datetime
 from collections import Counter
 from config import PREFERENCES_FILE, CONFIDENCE_THRESHOLD
 
+_PRICE_RE = re.compile(r'\d+(?:[.,]\d+)?')
+
+# Histories below this size are read normally - mmap setup costs more than
+# it saves on small files
+_MMAP_MIN_SIZE = 64 * 1024
+
+
+def _parse_price(value):
+    """Parse a price into euros, handling '€ 18,50' style display strings."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _PRICE_RE.search(str(value))
+    return float(match.group().replace(',', '.')) if match else None
+
 
 class PreferenceEngine:
     """Learns and predicts user preferences for tennis court bookings."""
@@ -13,30 +31,73 @@ class PreferenceEngine:
     def __init__(self, preferences_file=PREFERENCES_FILE):
         self.preferences_file = preferences_file
         self.selections = []
-        self.load_preferences()
+        # Lazily-built history stats, kept in sync as selections are logged
+        self._cache_dirty = True
+        self._cached_counters = None
+        self._cached_score_tables = None
+        self._cached_avg_price = None
+        self._price_sum = 0.0
+        self._price_count = 0
+        # History is loaded lazily on first use - cold starts that never
+        # touch preferences skip the disk read entirely
+        self._loaded = False
 
     def load_preferences(self):
-        """Load user selection history from JSON file."""
-        if os.path.exists(self.preferences_file):
-            try:
-                with open(self.preferences_file, 'r') as f:
-                    data = json.load(f)
-                    self.selections = data.get('selections', [])
-            except Exception as e:
-                print(f"Error loading preferences: {e}")
-                self.selections = []
-        else:
+        """Load user selection history from the JSONL log."""
+        self.selections = []
+        try:
+            if os.path.exists(self.preferences_file):
+                if os.path.getsize(self.preferences_file) >= _MMAP_MIN_SIZE:
+                    # Large history: map the file instead of copying it into
+                    # a userspace buffer; pages fault in on demand
+                    with open(self.preferences_file, 'rb') as f, \
+                            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        for line in iter(mm.readline, b''):
+                            line = line.strip()
+                            if line:
+                                self.selections.append(json.loads(line))
+                else:
+                    with open(self.preferences_file, 'r') as f:
+                        for line in f:
+                            line = line.strip()
+                            if line:
+                                self.selections.append(json.loads(line))
+            else:
+                self._migrate_legacy_file()
+        except Exception as e:
+            print(f"Error loading preferences: {e}")
             self.selections = []
+        self._cache_dirty = True
+        self._loaded = True
+
+    def _lazy_load(self):
+        """Load the history on first use."""
+        if not self._loaded:
+            self.load_preferences()
+
+    def _migrate_legacy_file(self):
+        """One-time import of the old single-document JSON history."""
+        legacy_file = os.path.splitext(self.preferences_file)[0] + '.json'
+        if legacy_file != self.preferences_file and os.path.exists(legacy_file):
+            with open(legacy_file, 'r') as f:
+                self.selections = json.load(f).get('selections', [])
+            if self.selections:
+                self.save_preferences()
 
     def save_preferences(self):
-        """Save user selection history to JSON file."""
-        data = {
-            'selections': self.selections,
-            'last_updated': datetime.now().isoformat()
-        }
+        """Rewrite the full selection history to the JSONL log."""
         try:
             with open(self.preferences_file, 'w') as f:
-                json.dump(data, f, indent=2)
+                for selection in self.selections:
+                    f.write(json.dumps(selection, separators=(',', ':')) + '\n')
+        except Exception as e:
+            print(f"Error saving preferences: {e}")
+
+    def _append_selection(self, selection):
+        """Append one selection to the log without rewriting the history."""
+        try:
+            with open(self.preferences_file, 'a') as f:
+                f.write(json.dumps(selection, separators=(',', ':')) + '\n')
         except Exception as e:
             print(f"Error saving preferences: {e}")
 
@@ -47,6 +108,13 @@ class PreferenceEngine:
         Args:
             slot: dict with venue, date, time, price, etc.
         """
+        self._lazy_load()
+
+        # Store the numeric price so averaging never re-parses strings
+        price_eur = slot.get('price_eur')
+        if price_eur is None:
+            price_eur = _parse_price(slot.get('price'))
+
         selection = {
             'timestamp': datetime.now().isoformat(),
             'venue': slot.get('venue'),
@@ -55,13 +123,20 @@ class PreferenceEngine:
             'day_of_week': slot.get('day_of_week'),
             'time_of_day': self._categorize_time_of_day(slot.get('time')),
             'price': slot.get('price'),
+            'price_eur': price_eur,
             'court_type': slot.get('court_type'),
             'location': slot.get('location'),
             'indoor_outdoor': slot.get('indoor_outdoor')
         }
 
         self.selections.append(selection)
-        self.save_preferences()
+        if self._cache_dirty:
+            # Cache will be rebuilt lazily from the full history
+            pass
+        else:
+            # Fold the new record into the cached stats - no rescan needed
+            self._update_cache(selection)
+        self._append_selection(selection)
 
     def _categorize_time_of_day(self, time_str):
         """Categorize time into morning/afternoon/evening."""
@@ -81,8 +156,17 @@ class PreferenceEngine:
 
     def has_confidence(self):
         """Check if we have enough data to make confident predictions."""
+        if not self._loaded and not self._history_file_exists():
+            # Nothing on disk - no point loading just to find zero selections
+            return False
+        self._lazy_load()
         return len(self.selections) >= CONFIDENCE_THRESHOLD
 
+    def _history_file_exists(self):
+        """Check for a stored history, including the legacy JSON file."""
+        return (os.path.exists(self.preferences_file)
+                or os.path.exists(os.path.splitext(self.preferences_file)[0] + '.json'))
+
     def get_preferred_slot(self, available_slots):
         """
         Predict the preferred slot from available options.
@@ -90,81 +174,124 @@ class PreferenceEngine:
         Returns:
             dict with preferred slot or None if not confident
         """
+        index = self.get_preferred_index(available_slots)
+        return available_slots[index] if index is not None else None
+
+    def get_preferred_index(self, available_slots):
+        """
+        Predict the index of the preferred slot from available options.
+
+        Returning the index directly lets callers highlight the slot in a
+        result list without an O(N) dict-equality scan via list.index().
+
+        Returns:
+            int index into available_slots, or None if not confident
+        """
         if not self.has_confidence() or not available_slots:
             return None
 
-        # Calculate scores for each slot based on historical preferences
-        scored_slots = []
+        self._ensure_cache()
+        venue_scores, tod_scores, day_scores = self._cached_score_tables
+        avg_price = self._cached_avg_price
 
-        for slot in available_slots:
-            score = self._calculate_preference_score(slot)
-            scored_slots.append((score, slot))
+        # Bulk-score every slot in one comprehension over pre-weighted lookup
+        # tables, then pick the argmax. Each slot costs three dict gets plus
+        # the price term instead of a method call that re-weights counters.
+        categorize = self._categorize_time_of_day
+        scores = [
+            venue_scores.get(slot.get('venue'), 0.0)
+            + tod_scores.get(categorize(slot.get('time')), 0.0)
+            + day_scores.get(slot.get('day_of_week'), 0.0)
+            + self._price_score(slot, avg_price)
+            for slot in available_slots
+        ]
 
-        # Sort by score (highest first)
-        scored_slots.sort(reverse=True, key=lambda x: x[0])
+        return max(range(len(scores)), key=scores.__getitem__)
 
-        # Return the top-scored slot
-        return scored_slots[0][1] if scored_slots else None
+    def _ensure_cache(self):
+        """Rebuild cached history stats if selections changed since last build.
 
-    def _calculate_preference_score(self, slot):
-        """Calculate preference score for a slot based on history."""
-        score = 0.0
+        The counters, weighted score tables and average price only depend on
+        the selection history, so they are computed once and reused across
+        scoring calls until log_selection or load_preferences dirties them.
+        """
+        if not self._cache_dirty:
+            return
 
-        # Extract preferences from history
         venue_counts = Counter(s['venue'] for s in self.selections if s.get('venue'))
         time_of_day_counts = Counter(s['time_of_day'] for s in self.selections if s.get('time_of_day'))
         day_of_week_counts = Counter(s['day_of_week'] for s in self.selections if s.get('day_of_week'))
+        self._cached_counters = (venue_counts, time_of_day_counts, day_of_week_counts)
 
-        # Venue preference (weight: 3)
-        if slot.get('venue') in venue_counts:
-            venue_score = venue_counts[slot['venue']] / len(self.selections)
-            score += venue_score * 3
-
-        # Time of day preference (weight: 2)
-        slot_time_category = self._categorize_time_of_day(slot.get('time'))
-        if slot_time_category in time_of_day_counts:
-            time_score = time_of_day_counts[slot_time_category] / len(self.selections)
-            score += time_score * 2
-
-        # Day of week preference (weight: 1.5)
-        if slot.get('day_of_week') in day_of_week_counts:
-            day_score = day_of_week_counts[slot['day_of_week']] / len(self.selections)
-            score += day_score * 1.5
-
-        # Price preference (weight: 1) - prefer similar prices
-        avg_price = self._get_average_price()
-        if avg_price and slot.get('price'):
-            try:
-                slot_price = float(slot['price'])
-                price_diff = abs(slot_price - avg_price)
-                # Lower difference = higher score
-                price_score = max(0, 1 - (price_diff / avg_price))
-                score += price_score
-            except:
-                pass
-
-        return score
-
-    def _get_average_price(self):
-        """Calculate average price from selections."""
-        prices = []
+        self._price_sum = 0.0
+        self._price_count = 0
         for s in self.selections:
-            if s.get('price'):
-                try:
-                    prices.append(float(s['price']))
-                except:
-                    pass
+            # Records logged before price_eur existed fall back to parsing
+            # the display string
+            p = s.get('price_eur')
+            if p is None:
+                p = _parse_price(s.get('price'))
+            if p is not None:
+                self._price_sum += p
+                self._price_count += 1
+
+        self._rebuild_derived()
+        self._cache_dirty = False
+
+    def _update_cache(self, selection):
+        """Fold one newly logged selection into the cached stats."""
+        venue_counts, time_of_day_counts, day_of_week_counts = self._cached_counters
+        if selection.get('venue'):
+            venue_counts[selection['venue']] += 1
+        if selection.get('time_of_day'):
+            time_of_day_counts[selection['time_of_day']] += 1
+        if selection.get('day_of_week'):
+            day_of_week_counts[selection['day_of_week']] += 1
+        if selection.get('price_eur') is not None:
+            self._price_sum += selection['price_eur']
+            self._price_count += 1
+        self._rebuild_derived()
 
-        return sum(prices) / len(prices) if prices else None
+    def _rebuild_derived(self):
+        """Recompute the weighted score tables and average from the counters.
+
+        Score tables map a feature value (venue name, time-of-day category,
+        weekday) directly to its weighted frequency contribution, so scoring
+        needs no arithmetic beyond a sum of lookups. Rebuilding them is
+        O(unique values), not O(history).
+        Feature weights: venue 3, time of day 2, day of week 1.5
+        """
+        venue_counts, time_of_day_counts, day_of_week_counts = self._cached_counters
+        inv_total = 1.0 / len(self.selections) if self.selections else 0.0
+        self._cached_score_tables = (
+            {v: c * inv_total * 3 for v, c in venue_counts.items()},
+            {t: c * inv_total * 2 for t, c in time_of_day_counts.items()},
+            {d: c * inv_total * 1.5 for d, c in day_of_week_counts.items()},
+        )
+        self._cached_avg_price = (
+            self._price_sum / self._price_count if self._price_count else None)
+
+    @staticmethod
+    def _price_score(slot, avg_price):
+        """Score price similarity to the historical average (weight: 1)."""
+        if not avg_price:
+            return 0.0
+        slot_price = slot.get('price_eur')
+        if slot_price is None:
+            slot_price = _parse_price(slot.get('price'))
+        if slot_price is None:
+            return 0.0
+        # Lower difference = higher score
+        return max(0, 1 - abs(slot_price - avg_price) / avg_price)
 
     def get_preference_summary(self):
         """Get a summary of learned preferences."""
+        self._lazy_load()
         if not self.selections:
             return "No preferences learned yet."
 
-        venue_counts = Counter(s['venue'] for s in self.selections if s.get('venue'))
-        time_counts = Counter(s['time_of_day'] for s in self.selections if s.get('time_of_day'))
-        day_counts = Counter(s['day_of_week'] for s in self.selections if s.get('day_of_week'))
+        self._ensure_cache()
+        venue_counts, time_counts, day_counts = self._cached_counters
 
         summary = f"Learned from {len(self.selections)} selections:\n"
         summary += f"  Favorite venues: {', '.join(v for v, _ in venue_counts.most_common(3))}\n"
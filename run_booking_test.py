@@ -12,9 +12,14 @@ if __name__ == '__main__':
     # Now import our modules
     from booking import DasSpielBooker
     import requests
+    import html
     import json
     import re
 
+    # Compiled once so repeated calendar fetches don't re-parse the pattern.
+    # Bytes pattern: the page is scanned as it streams in, before decoding.
+    _META_RE = re.compile(rb'<meta[^>]+id="transfer-data-calendar"[^>]+data-content="([^"]+)"')
+
     print("=" * 70)
     print("BOOKING TEST: Platz 5 on January 21, 2026 at 10:00")
     print("=" * 70)
@@ -42,19 +47,23 @@ if __name__ == '__main__':
     }
 
     try:
-        response = booker.session.get(url, headers=headers, timeout=10)
-        page_source = response.text
-
-        # Find the calendar data meta tag
-        meta_pattern = r'<meta[^>]+id="transfer-data-calendar"[^>]+data-content="([^"]+)"'
-        match = re.search(meta_pattern, page_source)
+        # Stream the page and stop downloading once the calendar meta tag
+        # appears - usually in the <head>, far before the end of the page
+        with booker.session.get(url, headers=headers, stream=True, timeout=10) as response:
+            buf = bytearray()
+            match = None
+            for chunk in response.iter_content(chunk_size=16384):
+                buf += chunk
+                match = _META_RE.search(buf)
+                if match:
+                    break
 
         if not match:
             print("ERROR: Could not find calendar data in page")
             sys.exit(1)
 
-        # Decode HTML entities
-        calendar_json = match.group(1).replace('&quot;', '"')
+        # Decode HTML entities - covers &amp;, &#x27; etc., not just &quot;
+        calendar_json = html.unescape(match.group(1).decode('utf-8'))
         calendar_data = json.loads(calendar_json)
 
         print(f"SUCCESS: Found {len(calendar_data)} courts")
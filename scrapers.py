@@ -1,6 +1,6 @@
 """Web scrapers for tennis court booking portals."""
 
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -38,6 +38,18 @@ class BaseScraper:
         if self.driver:
             self.driver.quit()
 
+    def _get_iframe_sources(self):
+        """Return the HTML of every same-origin iframe in one script call.
+
+        Avoids the switch_to.frame / page_source / switch_to.default_content
+        round-trips, which serialize the whole DOM over the wire per frame.
+        """
+        return self.driver.execute_script(
+            "return Array.from(document.querySelectorAll('iframe')).map(function (f) {"
+            " try { return f.contentDocument ? f.contentDocument.documentElement.outerHTML : null; }"
+            " catch (e) { return null; } });"
+        )
+
     def scrape(self, date, start_time, end_time):
         """
         Scrape available courts for given timeframe.
@@ -69,16 +81,13 @@ class DasSpielScraper(BaseScraper):
             print(f"Accessing {self.URL}...")
             self.driver.get(self.URL)
 
-            # Wait for page to load
-            time.sleep(3)
-
             # Try to find and interact with the booking interface
             # This will need to be adjusted based on the actual site structure
             print("Analyzing Das Spiel website structure...")
 
             # Look for common booking elements
             try:
-                # Wait for any interactive elements
+                # Wait for actual content instead of sleeping a fixed 3s
                 WebDriverWait(self.driver, 10).until(
                     EC.presence_of_element_located((By.TAG_NAME, "body"))
                 )
@@ -92,33 +101,23 @@ class DasSpielScraper(BaseScraper):
                 if date_inputs:
                     print(f"Found {len(date_inputs)} date input fields")
 
-                # Look for iframes (booking systems often use iframes)
-                iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
-
-                if iframes:
-                    print(f"Found {len(iframes)} iframes")
-                    for i, iframe in enumerate(iframes):
-                        try:
-                            self.driver.switch_to.frame(iframe)
-                            print(f"Switched to iframe {i}")
-
-                            # Try to find booking interface in iframe
-                            time.sleep(2)
-                            iframe_source = self.driver.page_source
+                # Pull every iframe's HTML in one script call - no
+                # switch_to.frame round-trips, sleeps, or full page_source
+                # serialization per frame (cross-origin frames come back None)
+                iframe_sources = self._get_iframe_sources()
 
+                if iframe_sources:
+                    print(f"Found {len(iframe_sources)} iframes")
+                    for iframe_source in iframe_sources:
+                        if iframe_source:
                             # Look for availability indicators
                             available_slots = self._extract_slots_from_page(
                                 iframe_source, date, start_time, end_time, "Das Spiel"
                             )
                             results.extend(available_slots)
 
-                            self.driver.switch_to.default_content()
-                        except Exception as e:
-                            print(f"Error processing iframe {i}: {e}")
-                            self.driver.switch_to.default_content()
-
                 # If no iframes, analyze main page
-                if not iframes or not results:
+                if not iframe_sources or not results:
                     main_slots = self._extract_slots_from_page(
                         page_source, date, start_time, end_time, "Das Spiel"
                     )
@@ -134,24 +133,10 @@ class DasSpielScraper(BaseScraper):
 
     def _extract_slots_from_page(self, page_source, date, start_time, end_time, venue_name):
         """Extract available slots from page source."""
-        slots = []
-
-        # Look for common availability indicators in the HTML
-        # This is a placeholder - needs to be adjusted based on actual site
-
-        # Example: Look for time slots in the page
-        import re
-
-        # Common patterns for time slots
-        time_pattern = r'(\d{1,2}):(\d{2})'
-        matches = re.findall(time_pattern, page_source)
-
-        if matches:
-            print(f"Found {len(matches)} potential time slots")
-
-        # For now, return a mock result to indicate the site was accessed
-        # This will be refined once we see the actual structure
-        return slots
+        # Placeholder - needs to be adjusted based on the actual site
+        # structure once we see it. No point scanning the whole page source
+        # for time-like strings until then.
+        return []
 
 
 class PostSVScraper(BaseScraper):
@@ -170,13 +155,10 @@ class PostSVScraper(BaseScraper):
             print(f"Accessing {self.URL}...")
             self.driver.get(self.URL)
 
-            # Wait for page to load
-            time.sleep(3)
-
             print("Analyzing Post SV Wien website structure...")
 
             try:
-                # Wait for page to load
+                # Wait for actual content instead of sleeping a fixed 3s
                 WebDriverWait(self.driver, 10).until(
                     EC.presence_of_element_located((By.TAG_NAME, "body"))
                 )
@@ -190,30 +172,19 @@ class PostSVScraper(BaseScraper):
                 if date_inputs:
                     print(f"Found {len(date_inputs)} date input fields")
 
-                # Look for iframes
-                iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
-
-                if iframes:
-                    print(f"Found {len(iframes)} iframes")
-                    for i, iframe in enumerate(iframes):
-                        try:
-                            self.driver.switch_to.frame(iframe)
-                            print(f"Switched to iframe {i}")
-
-                            time.sleep(2)
-                            iframe_source = self.driver.page_source
+                # Pull every iframe's HTML in one script call
+                iframe_sources = self._get_iframe_sources()
 
+                if iframe_sources:
+                    print(f"Found {len(iframe_sources)} iframes")
+                    for iframe_source in iframe_sources:
+                        if iframe_source:
                             available_slots = self._extract_slots_from_page(
                                 iframe_source, date, start_time, end_time, "Post SV Wien"
                             )
                             results.extend(available_slots)
 
-                            self.driver.switch_to.default_content()
-                        except Exception as e:
-                            print(f"Error processing iframe {i}: {e}")
-                            self.driver.switch_to.default_content()
-
-                if not iframes or not results:
+                if not iframe_sources or not results:
                     main_slots = self._extract_slots_from_page(
                         page_source, date, start_time, end_time, "Post SV Wien"
                     )
@@ -229,45 +200,53 @@ class PostSVScraper(BaseScraper):
 
     def _extract_slots_from_page(self, page_source, date, start_time, end_time, venue_name):
         """Extract available slots from page source."""
-        slots = []
+        # Placeholder - see DasSpielScraper._extract_slots_from_page
+        return []
 
-        import re
 
-        time_pattern = r'(\d{1,2}):(\d{2})'
-        matches = re.findall(time_pattern, page_source)
+def _scrape_portal(portal_name, scraper, date, start_time, end_time):
+    """Run one portal scrape with its own browser, closing it afterwards."""
+    print("\n" + "="*60)
+    print(f"Scraping {portal_name}...")
+    print("="*60)
+    try:
+        results = scraper.scrape(date, start_time, end_time)
+        print(f"Found {len(results)} slots from {portal_name}")
+        return results
+    finally:
+        scraper.close()
 
-        if matches:
-            print(f"Found {len(matches)} potential time slots")
 
-        return slots
+def scrape_all_portals(date, start_time, end_time, use_selenium=False):
+    """Scrape all configured portals and return combined results.
 
+    Defaults to the requests-based V2 scrapers, which fetch the same data
+    without paying browser startup and page-rendering costs (seconds and
+    hundreds of MB per portal). The Selenium path stays available behind
+    use_selenium for portals that ever require JS execution; each one then
+    runs in its own thread with its own WebDriver, so the wall-clock cost
+    is the slowest portal rather than the sum of both.
+    """
+    if not use_selenium:
+        from scrapers_v2 import scrape_all_portals as scrape_all_portals_v2
+        return scrape_all_portals_v2(date, start_time, end_time)
 
-def scrape_all_portals(date, start_time, end_time):
-    """Scrape all configured portals and return combined results."""
     all_results = []
 
-    # Das Spiel
-    print("\n" + "="*60)
-    print("Scraping Das Spiel (Tenniszentrum Arsenal)...")
-    print("="*60)
-    dasspiel = DasSpielScraper()
-    try:
-        dasspiel_results = dasspiel.scrape(date, start_time, end_time)
-        all_results.extend(dasspiel_results)
-        print(f"Found {len(dasspiel_results)} slots from Das Spiel")
-    finally:
-        dasspiel.close()
-
-    # Post SV
-    print("\n" + "="*60)
-    print("Scraping Post SV Wien...")
-    print("="*60)
-    postsv = PostSVScraper()
-    try:
-        postsv_results = postsv.scrape(date, start_time, end_time)
-        all_results.extend(postsv_results)
-        print(f"Found {len(postsv_results)} slots from Post SV Wien")
-    finally:
-        postsv.close()
+    portals = [
+        ('Das Spiel (Tenniszentrum Arsenal)', DasSpielScraper()),
+        ('Post SV Wien', PostSVScraper()),
+    ]
+
+    with ThreadPoolExecutor(max_workers=len(portals)) as executor:
+        futures = [
+            (name, executor.submit(_scrape_portal, name, scraper, date, start_time, end_time))
+            for name, scraper in portals
+        ]
+        for name, future in futures:
+            try:
+                all_results.extend(future.result())
+            except Exception as e:
+                print(f"Error scraping {name}: {e}")
 
     return all_results
@@ -1,10 +1,115 @@
 """Web scrapers for tennis court booking portals - Version 2."""
 
+import functools
+import html
 import json
+import logging
+import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+from config import MAX_CONCURRENCY
+
+logger = logging.getLogger(__name__)
+
+# Optional C-accelerated decoder for the multi-KB calendar payload; the
+# stdlib is the fallback, same as with the lxml parser below
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Prefer the C-based lxml parser - several times faster on the Post SV
+# booking tables - but keep working if only the stdlib parser is available
+try:
+    BeautifulSoup(b'', 'lxml')
+    _BS_PARSER = 'lxml'
+except FeatureNotFound:
+    _BS_PARSER = 'html.parser'
+
+# Bound concurrent outbound requests across all scraper threads so the portal
+# fan-out can't trigger rate limiting or connection resets (tunable via
+# TB_MAX_CONCURRENCY).
+_REQUEST_SEMAPHORE = threading.Semaphore(MAX_CONCURRENCY)
+
+# Serializes multi-line log banners so concurrent portal threads don't
+# interleave their output mid-block
+_PRINT_LOCK = threading.Lock()
+
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+
+def _build_pooled_session():
+    """Create a Session with connection pooling and the default headers."""
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    session.headers['User-Agent'] = _USER_AGENT
+    return session
+
+
+# Shared across DasSpielScraperV2 instances: a scraper is recreated per
+# search, but the TLS connections survive in this pool, so repeated scrapes
+# skip the TCP/TLS handshake
+_DASSPIEL_SESSION = _build_pooled_session()
+
+# The whole calendar payload lives in one meta tag, so a targeted regex on
+# the raw bytes beats building a BeautifulSoup DOM for the entire page
+_CALENDAR_META_RE = re.compile(
+    rb'<meta[^>]*id=["\']transfer-data-calendar["\'][^>]*data-content=["\']([^"\']+)["\']')
+
+# Only the reservation tables matter on the Post SV booking page; parsing
+# just them keeps the tree (and every find_all over it) small
+_SCROLL_TABLE_STRAINER = SoupStrainer('table', class_='scroll-table')
+
+# Patterns used once per reservation cell - compiled ahead of the hot loop
+_SLOT_TIME_RE = re.compile(r'time=(\d+)')
+_SLOT_PRICE_RE = re.compile(r'€\s*([\d,]+)')
+
+_CREDENTIALS_FILE = 'credentials.json'
+
+# Separate connect/read timeouts, and a hard cap on body size so a
+# misbehaving portal can't balloon memory before parsing even starts
+_REQUEST_TIMEOUT = (3.05, 10)
+_MAX_RESPONSE_BYTES = 2 * 1024 * 1024
+
+
+def _bounded_get(session, url, **kwargs):
+    """GET a page, returning (response, body) with the body size capped."""
+    with _REQUEST_SEMAPHORE:
+        with session.get(url, timeout=_REQUEST_TIMEOUT, stream=True, **kwargs) as response:
+            body = response.raw.read(_MAX_RESPONSE_BYTES + 1, decode_content=True)
+    if len(body) > _MAX_RESPONSE_BYTES:
+        raise IOError(f"Response larger than {_MAX_RESPONSE_BYTES} bytes from {url}")
+    return response, body
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_credentials_file(mtime):
+    """Parse the credentials file, cached per mtime.
+
+    Scrapers are instantiated fresh on every search, so without the cache
+    each request would re-open and re-parse the same file. The mtime key
+    makes edits to the file take effect immediately.
+    """
+    try:
+        with open(_CREDENTIALS_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _get_credentials(portal):
+    """Return the stored credentials for one portal, or an empty dict."""
+    try:
+        mtime = os.stat(_CREDENTIALS_FILE).st_mtime
+    except OSError:
+        return {}
+    return _parse_credentials_file(mtime).get(portal, {})
 
 
 class DasSpielScraperV2:
@@ -12,6 +117,9 @@ class DasSpielScraperV2:
 
     URL = "https://reservierung.dasspiel.at/"
 
+    def __init__(self):
+        self.session = _DASSPIEL_SESSION
+
     def scrape(self, date, start_time, end_time):
         """Scrape Das Spiel booking portal."""
         results = []
@@ -20,22 +128,27 @@ class DasSpielScraperV2:
             # Fetch with date parameter to get booking data
             url_with_date = f"{self.URL}?date={date.strftime('%Y-%m-%d')}"
             print(f"Fetching {url_with_date}...")
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(url_with_date, headers=headers, timeout=10)
+            response, content = _bounded_get(self.session, url_with_date)
             response.raise_for_status()
 
-            # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Extract calendar data from meta tag
-            calendar_meta = soup.find('meta', {'id': 'transfer-data-calendar'})
-            if calendar_meta and calendar_meta.get('data-content'):
-                calendar_json = calendar_meta['data-content']
+            # Extract calendar data from the meta tag without parsing the
+            # whole page
+            match = _CALENDAR_META_RE.search(content)
+            if match:
+                calendar_json = match.group(1).decode('utf-8')
+            else:
+                # Fall back to a real parse in case the attributes are ever
+                # reordered or quoted differently
+                soup = BeautifulSoup(content, _BS_PARSER)
+                calendar_meta = soup.find('meta', {'id': 'transfer-data-calendar'})
+                calendar_json = (calendar_meta['data-content']
+                                 if calendar_meta and calendar_meta.get('data-content')
+                                 else None)
+
+            if calendar_json:
                 # Decode HTML entities
-                calendar_json = calendar_json.replace('&quot;', '"')
-                calendar_data = json.loads(calendar_json)
+                calendar_json = html.unescape(calendar_json)
+                calendar_data = _json_loads(calendar_json)
 
                 print(f"Found {len(calendar_data)} courts")
 
@@ -51,17 +164,18 @@ class DasSpielScraperV2:
                     timeblock = court.get('timeblock', 60)  # minutes
                     rentals = court.get('rentals', [])
 
-                    # Build set of booked time slots from rentals
-                    booked_times = set()
+                    # Parse rentals once into sorted (start, end) minute
+                    # intervals; slot generation walks the gaps between them
+                    booked_intervals = []
                     for rental in rentals:
                         rental_start = rental.get('time_start', '')
                         rental_end = rental.get('time_end', '')
-                        # Add all hours in this rental period
                         if rental_start and rental_end:
-                            start_hour = int(rental_start.split(':')[0])
-                            end_hour = int(rental_end.split(':')[0])
-                            for hour in range(start_hour, end_hour):
-                                booked_times.add(f"{hour:02d}:00")
+                            start_h, start_m = map(int, rental_start.split(':')[:2])
+                            end_h, end_m = map(int, rental_end.split(':')[:2])
+                            booked_intervals.append(
+                                (start_h * 60 + start_m, end_h * 60 + end_m))
+                    booked_intervals.sort()
 
                     # Generate available slots (only free ones)
                     slots = self._generate_available_slots(
@@ -73,63 +187,79 @@ class DasSpielScraperV2:
                         time_start,
                         time_end,
                         timeblock,
-                        booked_times
+                        booked_intervals
                     )
                     results.extend(slots)
 
             print(f"Total available FREE slots found: {len(results)}")
 
-        except Exception as e:
-            print(f"Error scraping Das Spiel: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            # logger.exception is lazy and level-gated, unlike formatting a
+            # traceback to stdout on every failure
+            logger.exception("Error scraping Das Spiel")
 
         return results
 
 
     def _generate_available_slots(self, court_name, square_id, date, user_start, user_end,
-                                   court_start, court_end, timeblock, booked_times):
+                                   court_start, court_end, timeblock, booked_intervals):
         """Generate available time slots for a court."""
         slots = []
 
-        # Parse times
+        # Parse times once into minutes from midnight - the loop below is
+        # plain int math instead of datetime arithmetic and strftime
         user_start_hour, user_start_min = map(int, user_start.split(':'))
         user_end_hour, user_end_min = map(int, user_end.split(':'))
         court_start_hour = int(court_start.split(':')[0])
         court_end_hour = int(court_end.split(':')[0])
 
-        # Create time range for the day
-        current = datetime.combine(date, datetime.min.time()).replace(
-            hour=max(user_start_hour, court_start_hour),
-            minute=user_start_min if user_start_hour >= court_start_hour else 0
-        )
-
-        end_datetime = datetime.combine(date, datetime.min.time()).replace(
-            hour=min(user_end_hour, court_end_hour),
-            minute=user_end_min if user_end_hour <= court_end_hour else 0
-        )
-
-        while current < end_datetime:
-            time_str = current.strftime('%H:%M')
-
-            # Check if this slot is not booked
-            if time_str not in booked_times:
-                slot = {
-                    'venue': 'Tenniszentrum Arsenal (Das Spiel)',
-                    'date': date.strftime('%Y-%m-%d'),
-                    'day_of_week': date.strftime('%A'),
-                    'time': time_str,
-                    'court_name': court_name,
-                    'square_id': square_id,  # Add court UUID for booking API
-                    'court_type': 'Indoor' if 'HALLE' in court_name.upper() else 'Outdoor',
-                    'indoor_outdoor': 'Indoor' if 'HALLE' in court_name.upper() else 'Outdoor',
-                    'duration': f"{timeblock} min",
-                    'location': 'Arsenal, Wien',
-                    'price': 'N/A',  # Price info not in the data
-                }
+        # Iterate only the intersection of the requested window and the
+        # court's operating hours - out-of-window slots never get generated
+        start_min = max(user_start_hour * 60 + user_start_min, court_start_hour * 60)
+        end_min = min(user_end_hour * 60 + user_end_min, court_end_hour * 60)
+
+        # Everything except the time is identical across this court's slots,
+        # so build it once and copy per free slot
+        court_type = 'Indoor' if 'HALLE' in court_name.upper() else 'Outdoor'
+        base_slot = {
+            'venue': 'Tenniszentrum Arsenal (Das Spiel)',
+            'date': date.strftime('%Y-%m-%d'),
+            'day_of_week': date.strftime('%A'),
+            'time': '',
+            'court_name': court_name,
+            'square_id': square_id,  # Add court UUID for booking API
+            'court_type': court_type,
+            'indoor_outdoor': court_type,
+            'duration': f"{timeblock} min",
+            'location': 'Arsenal, Wien',
+            'price': 'N/A',  # Price info not in the data
+            'price_eur': None,
+        }
+
+        # Walk the gaps between the sorted rentals instead of testing every
+        # grid point against them - each rental and each free slot is
+        # touched exactly once, and range() does the stepping in C. The
+        # cursor only ever advances by whole timeblocks, so the slot grid
+        # stays anchored at start_min.
+        cursor = start_min
+        for booked_start, booked_end in booked_intervals:
+            if booked_end <= cursor:
+                continue
+            for minutes in range(cursor, min(booked_start, end_min), timeblock):
+                hour, minute = divmod(minutes, 60)
+                slot = base_slot.copy()
+                slot['time'] = f"{hour:02d}:{minute:02d}"
                 slots.append(slot)
+            if booked_start >= end_min:
+                return slots
+            if booked_end > cursor:
+                cursor += -(-(booked_end - cursor) // timeblock) * timeblock
 
-            current += timedelta(minutes=timeblock)
+        for minutes in range(cursor, end_min, timeblock):
+            hour, minute = divmod(minutes, 60)
+            slot = base_slot.copy()
+            slot['time'] = f"{hour:02d}:{minute:02d}"
+            slots.append(slot)
 
         return slots
 
@@ -140,27 +270,28 @@ class PostSVScraperV2:
     URL = "https://buchen.postsv-wien.at/tennis.html"
     LOGIN_URL = "https://buchen.postsv-wien.at/login-tennis.html"
 
+    # Re-login after this long even if the session cookie is still present,
+    # in case Contao expired it server-side
+    LOGIN_TTL = 30 * 60
+
     def __init__(self):
         self.session = requests.Session()
         self.credentials = self._load_credentials()
+        self._logged_in_at = 0.0
 
     def _load_credentials(self):
         """Load credentials from credentials.json if available."""
-        import os
-        cred_file = 'credentials.json'
-        if os.path.exists(cred_file):
-            try:
-                with open(cred_file, 'r') as f:
-                    data = json.load(f)
-                    return data.get('postsv', {})
-            except:
-                pass
-        return {}
+        return _get_credentials('postsv')
 
     def _login(self):
         """Attempt to login to Post SV Wien."""
-        if not self.credentials.get('username') or not self.credentials.get('password'):
-            return False
+        # A fresh Contao auth cookie means this session is already logged
+        # in - skip the login round-trip
+        if 'FE_USER_AUTH' in self.session.cookies:
+            if time.monotonic() - self._logged_in_at < self.LOGIN_TTL:
+                return True
+            # Cookie may have expired server-side - start over
+            self.session.cookies.clear()
 
         try:
             print(f"Attempting login with provided credentials...")
@@ -170,8 +301,8 @@ class PostSVScraperV2:
             }
 
             # Get login page first to extract form data
-            response = self.session.get(self.LOGIN_URL, headers=headers, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response, content = _bounded_get(self.session, self.LOGIN_URL, headers=headers)
+            soup = BeautifulSoup(content, _BS_PARSER)
 
             # Find login form
             form = soup.find('form', id='tl_login')
@@ -188,170 +319,209 @@ class PostSVScraperV2:
 
             # Submit login (add Referer header required by Contao CMS)
             headers['Referer'] = self.LOGIN_URL
-            response = self.session.post(self.LOGIN_URL, data=login_data, headers=headers, timeout=10, allow_redirects=True)
+            with _REQUEST_SEMAPHORE:
+                response = self.session.post(self.LOGIN_URL, data=login_data, headers=headers,
+                                             timeout=_REQUEST_TIMEOUT, allow_redirects=True)
 
             # Check if login was successful
             if 'login' not in response.url.lower() and response.status_code == 200:
                 print("Login successful!")
+                self._logged_in_at = time.monotonic()
                 return True
             else:
                 print("Login failed - check credentials")
                 return False
 
-        except Exception as e:
-            print(f"Login error: {e}")
+        except Exception:
+            logger.exception("Post SV login failed")
             return False
 
     def scrape(self, date, start_time, end_time):
         """Scrape Post SV Wien booking portal."""
         results = []
 
+        # Pick up credential changes even on the shared long-lived instance
+        # (cheap: the parsed file is cached on its mtime)
+        self.credentials = self._load_credentials()
+
+        # Without a full set of credentials the login can only fail, so
+        # don't pay the HTTP round-trip to find that out
+        if not self.credentials.get('username') or not self.credentials.get('password'):
+            print("No credentials found (create credentials.json from credentials.json.example)")
+            print("Cannot check availability without authentication")
+            return results
+
         try:
             print(f"Fetching {self.URL}...")
             print("Note: This portal requires login for full access.")
 
-            # Try to login if credentials are available
-            if self.credentials:
-                if self._login():
-                    # Fetch the booking page for the specific date
-                    date_str = date.strftime('%Y%m%d')
-                    date_url = f"{self.URL}?day={date_str}"
-
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                        'Referer': self.URL
-                    }
-                    response = self.session.get(date_url, headers=headers, timeout=10)
-
-                    if response.status_code == 200 and 'login' not in response.url.lower():
-                        print(f"Successfully fetched booking page for {date.strftime('%Y-%m-%d')}")
-
-                        # Parse the booking table
-                        soup = BeautifulSoup(response.content, 'html.parser')
-
-                        # Find all scroll tables
-                        tables = soup.find_all('table', class_='scroll-table')
-
-                        for table in tables:
-                            # Find all rows with court names
-                            all_rows = table.find_all('tr')
-
-                            for row in all_rows:
-                                # Find court name in this row
-                                court_cell = row.find('td', class_='ressourcename')
-                                if not court_cell:
-                                    continue
-
-                                court_name = court_cell.get_text().strip()
-
-                                # Find all cells in this row
-                                cells = row.find_all('td', class_='reservationcell')
-
-                                for cell in cells:
-                                    # Check if cell is free (available)
-                                    if 'free' in cell.get('class', []):
-                                        # Find the booking link
-                                        link = cell.find('a', class_='reservationlink')
-
-                                        if link:
-                                            # Extract time from href (format: time=SECONDS)
-                                            href = link.get('href', '')
-                                            time_match = re.search(r'time=(\d+)', href)
-
-                                            if time_match:
-                                                seconds = int(time_match.group(1))
-                                                hours = seconds // 3600
-                                                minutes = (seconds % 3600) // 60
-                                                time_str = f"{hours:02d}:{minutes:02d}"
-
-                                                # Filter by user's requested timeframe
-                                                if self._is_in_timeframe(time_str, start_time, end_time):
-                                                    # Extract price from title
-                                                    title = link.get('title', '')
-                                                    price_match = re.search(r'€\s*([\d,]+)', title)
-                                                    price = price_match.group(1) if price_match else 'N/A'
-
-                                                    slot = {
-                                                        'venue': 'Post SV Wien',
-                                                        'date': date.strftime('%Y-%m-%d'),
-                                                        'day_of_week': date.strftime('%A'),
-                                                        'time': time_str,
-                                                        'court_name': court_name,
-                                                        'court_type': 'Tennis',
-                                                        'indoor_outdoor': 'Mixed',  # Post SV has both
-                                                        'duration': '60 min',
-                                                        'location': 'Post SV Wien, Roggendorfgasse 2',
-                                                        'price': f"€ {price}",
-                                                        'booking_link': href,  # Store for booking
-                                                    }
-                                                    results.append(slot)
-
-                        print(f"Found {len(results)} slots in requested timeframe")
-                    else:
-                        print("Could not access booking page after login")
+            if self._login():
+                # Fetch the booking page for the specific date
+                date_str = date.strftime('%Y%m%d')
+                date_url = f"{self.URL}?day={date_str}"
+
+                headers = {
+                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                    'Referer': self.URL
+                }
+                response, content = _bounded_get(self.session, date_url, headers=headers)
+
+                if response.status_code == 200 and 'login' not in response.url.lower():
+                    print(f"Successfully fetched booking page for {date.strftime('%Y-%m-%d')}")
+
+                    # Parse the requested window once - the per-cell filter
+                    # below is then a single integer comparison
+                    try:
+                        start_h, start_m = map(int, start_time.split(':'))
+                        end_h, end_m = map(int, end_time.split(':'))
+                        window = (start_h * 60 + start_m, end_h * 60 + end_m)
+                    except (ValueError, AttributeError):
+                        window = None
+
+                    # Parse only the reservation tables, not the page chrome
+                    soup = BeautifulSoup(content, _BS_PARSER,
+                                         parse_only=_SCROLL_TABLE_STRAINER)
+
+                    # Rows with a court name are the only interesting ones
+                    for row in soup.find_all('tr'):
+                        # Find court name in this row
+                        court_cell = row.find('td', class_='ressourcename')
+                        if not court_cell:
+                            continue
+
+                        court_name = court_cell.get_text().strip()
+
+                        # Only free cells can yield bookable slots
+                        for cell in row.find_all('td', class_='free'):
+                            if 'reservationcell' in cell.get('class', []):
+                                # Find the booking link
+                                link = cell.find('a', class_='reservationlink')
+
+                                if link:
+                                    # Extract time from href (format: time=SECONDS)
+                                    href = link.get('href', '')
+                                    time_match = _SLOT_TIME_RE.search(href)
+
+                                    if time_match:
+                                        slot_minutes = int(time_match.group(1)) // 60
+
+                                        # Filter by user's requested timeframe
+                                        if window and window[0] <= slot_minutes < window[1]:
+                                            hours, minutes = divmod(slot_minutes, 60)
+                                            time_str = f"{hours:02d}:{minutes:02d}"
+                                            # Extract price from title, parsed to
+                                            # a float once here so scoring never
+                                            # re-parses the display string
+                                            title = link.get('title', '')
+                                            price_match = _SLOT_PRICE_RE.search(title)
+                                            if price_match:
+                                                price = price_match.group(1)
+                                                price_eur = float(price.replace(',', '.'))
+                                            else:
+                                                price = 'N/A'
+                                                price_eur = None
+
+                                            slot = {
+                                                'venue': 'Post SV Wien',
+                                                'date': date.strftime('%Y-%m-%d'),
+                                                'day_of_week': date.strftime('%A'),
+                                                'time': time_str,
+                                                'court_name': court_name,
+                                                'court_type': 'Tennis',
+                                                'indoor_outdoor': 'Mixed',  # Post SV has both
+                                                'duration': '60 min',
+                                                'location': 'Post SV Wien, Roggendorfgasse 2',
+                                                'price': f"€ {price}",
+                                                'price_eur': price_eur,
+                                                'booking_link': href,  # Store for booking
+                                            }
+                                            results.append(slot)
+
+                    print(f"Found {len(results)} slots in requested timeframe")
                 else:
-                    print("Login failed - cannot retrieve bookings")
+                    print("Could not access booking page after login")
             else:
-                print("No credentials found (create credentials.json from credentials.json.example)")
-                print("Cannot check availability without authentication")
+                print("Login failed - cannot retrieve bookings")
 
-        except Exception as e:
-            print(f"Error scraping Post SV Wien: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error scraping Post SV Wien")
 
         return results
 
-    def _is_in_timeframe(self, time_str, start_time, end_time):
-        """Check if a time is within the requested timeframe."""
-        try:
-            time_hour, time_min = map(int, time_str.split(':'))
-            start_hour, start_min = map(int, start_time.split(':'))
-            end_hour, end_min = map(int, end_time.split(':'))
+# One shared Post SV scraper so the Contao login session survives across
+# searches - otherwise every search pays the login GET + POST again
+_POSTSV_LOCK = threading.Lock()
+_POSTSV_SCRAPER = None
 
-            time_minutes = time_hour * 60 + time_min
-            start_minutes = start_hour * 60 + start_min
-            end_minutes = end_hour * 60 + end_min
 
-            return start_minutes <= time_minutes < end_minutes
-        except:
-            return False
+def _get_postsv_scraper():
+    """Return the shared PostSVScraperV2 instance, creating it on first use."""
+    global _POSTSV_SCRAPER
+    with _POSTSV_LOCK:
+        if _POSTSV_SCRAPER is None:
+            _POSTSV_SCRAPER = PostSVScraperV2()
+        return _POSTSV_SCRAPER
+
+
+def _scrape_portal(portal_name, scraper, date, start_time, end_time):
+    """Run one portal scrape with the usual log banner."""
+    with _PRINT_LOCK:
+        print("\n" + "="*60)
+        print(f"Scraping {portal_name}...")
+        print("="*60)
+    results = scraper.scrape(date, start_time, end_time)
+    with _PRINT_LOCK:
+        print(f"Found {len(results)} slots from {portal_name}\n")
+    return results
 
 
 def scrape_all_portals(date, start_time, end_time, locations=None):
-    """Scrape all configured portals and return combined results."""
+    """Scrape all configured portals and return combined results.
+
+    The portals are independent network-bound calls, so they run
+    concurrently - wall-clock time is the slowest portal instead of the
+    sum of both.
+    """
     all_results = []
 
     # Default to both locations if not specified
     if locations is None:
         locations = {'arsenal': True, 'postsv': True}
 
-    # Das Spiel (Arsenal)
+    portals = []
     if locations.get('arsenal', True):
-        print("\n" + "="*60)
-        print("Scraping Das Spiel (Tenniszentrum Arsenal)...")
-        print("="*60)
-        dasspiel = DasSpielScraperV2()
-        dasspiel_results = dasspiel.scrape(date, start_time, end_time)
-        all_results.extend(dasspiel_results)
-        print(f"Found {len(dasspiel_results)} slots from Das Spiel\n")
+        portals.append(('Das Spiel (Tenniszentrum Arsenal)', DasSpielScraperV2()))
     else:
         print("\n" + "="*60)
         print("Skipping Das Spiel (Arsenal) - not selected")
         print("="*60)
 
-    # Post SV
     if locations.get('postsv', True):
-        print("\n" + "="*60)
-        print("Scraping Post SV Wien...")
-        print("="*60)
-        postsv = PostSVScraperV2()
-        postsv_results = postsv.scrape(date, start_time, end_time)
-        all_results.extend(postsv_results)
-        print(f"Found {len(postsv_results)} slots from Post SV Wien\n")
+        portals.append(('Post SV Wien', _get_postsv_scraper()))
     else:
         print("\n" + "="*60)
         print("Skipping Post SV Wien - not selected")
         print("="*60)
 
+    if not portals:
+        return all_results
+
+    if len(portals) == 1:
+        # No point spinning up a thread pool for a single portal
+        name, scraper = portals[0]
+        return _scrape_portal(name, scraper, date, start_time, end_time)
+
+    with ThreadPoolExecutor(max_workers=len(portals)) as executor:
+        futures = [
+            (name, executor.submit(_scrape_portal, name, scraper, date, start_time, end_time))
+            for name, scraper in portals
+        ]
+        # Collect in submit order so Arsenal results still come first. A
+        # failure in one portal must not discard the other portal's results.
+        for name, future in futures:
+            try:
+                all_results.extend(future.result())
+            except Exception as e:
+                print(f"Error scraping {name}: {e}")
+
     return all_results
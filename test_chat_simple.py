@@ -3,21 +3,21 @@
 
 import re
 
+# Patterns like "option 1", "number 2", etc., compiled once
+_SLOT_PATTERNS = [re.compile(p) for p in (
+    r'option\s+(\d+)',
+    r'number\s+(\d+)',
+    r'slot\s+(\d+)',
+    r'#(\d+)',
+    r'^(\d+)$',
+)]
+
 
 def extract_slot_reference(message, context):
     """Extract reference to a slot from previous results."""
-    # Look for patterns like "option 1", "first one", "number 2", etc.
-    patterns = [
-        r'option\s+(\d+)',
-        r'number\s+(\d+)',
-        r'slot\s+(\d+)',
-        r'#(\d+)',
-        r'^(\d+)$'
-    ]
-
     msg_lower = message.lower()
-    for pattern in patterns:
-        match = re.search(pattern, msg_lower)
+    for pattern in _SLOT_PATTERNS:
+        match = pattern.search(msg_lower)
         if match:
             return int(match.group(1)) - 1  # Convert to 0-indexed
 
@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 """Test that the login timestamp fix works."""
 
+import logging
 import sqlite3
 import sys
 
 DATABASE_PATH = 'tennis_booking.db'
 
+logger = logging.getLogger(__name__)
+
 def test_database_connection():
     """Test that we can read user data without timestamp parsing errors."""
     print("Testing database connection and timestamp handling...")
@@ -34,10 +37,10 @@ def test_database_connection():
         print("✓ Test PASSED - No timestamp parsing errors!")
         return True
 
-    except Exception as e:
-        print(f"\n✗ Test FAILED: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        # Lazy, level-gated formatting instead of printing a traceback
+        # unconditionally
+        logger.exception("✗ Test FAILED")
         return False
 
 if __name__ == '__main__':
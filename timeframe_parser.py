@@ -1,9 +1,48 @@
 """Simple natural language parser for timeframe specifications."""
 
+import functools
 import re
 from datetime import datetime, timedelta
 from dateutil import parser as date_parser
 
+# All patterns compiled once at import time - parse() runs them on every
+# user input, and re.search with a string literal pays a cache lookup plus
+# call overhead each time. The date patterns are word-anchored so they
+# can't latch onto digits inside longer runs, and the day/month separator
+# is a backreference so mixed forms like '12./03.2025' don't match.
+_DATE_DMY = re.compile(r'\b(\d{1,2})([./])(\d{1,2})\2(\d{4})\b')  # DD.MM.YYYY or DD/MM/YYYY
+_DATE_ISO = re.compile(r'\b(\d{4})-(\d{1,2})-(\d{1,2})\b')  # YYYY-MM-DD
+# "at HH:MM" is searched on its own first so a specific single time keeps
+# priority over any range-looking text elsewhere in the input
+_AT_TIME = re.compile(r'\bat\s+(?P<at_h>\d{1,2}):(?P<at_m>\d{2})')
+# The range expressions share one alternation - a single scan over the
+# input with named groups telling the caller which form matched:
+# "HH:MM-HH:MM", "H-H" with optional pm/am, "H:MM pm - H:MM pm", or
+# "between X and Y". The bare H-H branch is fenced off from date digits:
+# the lookbehind keeps it from starting inside a run like 2026-01-21 and
+# the lookahead rejects an end hour glued to more date characters.
+_TIME_RANGE_RE = re.compile(
+    r'(?P<r1_sh>\d{1,2}):(?P<r1_sm>\d{2})\s*-\s*(?P<r1_eh>\d{1,2}):(?P<r1_em>\d{2})'
+    r'|(?<![\d-])(?P<r2_sh>\d{1,2})\s*-\s*(?P<r2_eh>\d{1,2})(?![\d./-])\s*(?P<r2_p>pm|am)?'
+    r'|(?P<r3_sh>\d{1,2}):(?P<r3_sm>\d{2})\s*(?P<r3_sp>pm|am)?'
+    r'\s*-\s*(?P<r3_eh>\d{1,2}):(?P<r3_em>\d{2})\s*(?P<r3_ep>pm|am)?'
+    r'|between\s+(?P<b_sh>\d{1,2}):?(?P<b_sm>\d{2})?\s+and\s+(?P<b_eh>\d{1,2}):?(?P<b_em>\d{2})?'
+)
+_WS = re.compile(r'\s+')
+
+# Mobile keyboard smart characters mapped back to their ASCII equivalents
+# in one table, applied with a single C-level str.translate pass
+_NORMALIZE_TABLE = str.maketrans({
+    '“': '"', '”': '"',  # Curly double quotes
+    '‘': "'", '’': "'",  # Curly single quotes
+    '„': '"',                 # German low double quote
+    '–': '-',                 # En dash
+    '—': '-',                 # Em dash
+    '−': '-',                 # Minus sign
+    '\u00A0': ' ',            # Non-breaking space
+    '\u202F': ' ',            # Narrow no-break space
+})
+
 
 class TimeframeParser:
     """Parses natural language timeframe specifications."""
@@ -18,8 +57,21 @@ class TimeframeParser:
         'sunday': 6, 'sun': 6
     }
 
-    def __init__(self):
-        self.today = datetime.now()
+    def __init__(self, now=None):
+        # Truncated to midnight so the reference date carries no
+        # time-of-day drift into the parsed results; passing `now` pins
+        # the reference date (for tests and batch parsing), otherwise a
+        # long-lived parser re-reads the clock on every parse so relative
+        # dates stay correct across midnight
+        self._today_pinned = now is not None
+        self.today = (now or datetime.now()).replace(
+            hour=0, minute=0, second=0, microsecond=0)
+
+    @classmethod
+    def parse_many(cls, texts):
+        """Parse several inputs against a single 'today' snapshot."""
+        parser = cls(now=datetime.now())
+        return [parser.parse(text) for text in texts]
 
     def parse(self, text):
         """
@@ -28,187 +80,178 @@ class TimeframeParser:
         Returns:
             dict with 'date', 'start_time', 'end_time'
         """
+        # Shared parser instances live across requests, so unless the
+        # caller pinned a date, refresh 'today' here - otherwise relative
+        # dates would stay computed against the construction day forever
+        # (this is also what lets the (text, day) cache entries below
+        # expire at midnight)
+        if not self._today_pinned:
+            today = datetime.now()
+            if today.toordinal() != self.today.toordinal():
+                self.today = today.replace(
+                    hour=0, minute=0, second=0, microsecond=0)
+
         text = text.lower().strip()
 
         # Normalize input to handle mobile keyboard smart characters
         text = self._normalize_input(text)
 
-        # Try to extract date
-        date_obj = self._extract_date(text)
-
-        # Try to extract time range
-        start_time, end_time = self._extract_time_range(text)
+        # Chat flows re-send the same input on retries and refreshes, so
+        # the regex work is cached on (text, day). Only immutable values
+        # cross the cache boundary; the dict and datetime are fresh per
+        # call so callers can't mutate a shared result.
+        date_ordinal, start_time, end_time = _parse_core(text, self.today.toordinal())
 
         return {
-            'date': date_obj,
+            'date': datetime.fromordinal(date_ordinal),
             'start_time': start_time,
             'end_time': end_time
         }
 
     def _normalize_input(self, text):
         """Normalize input text to handle mobile keyboard variations."""
-        # Replace smart/curly quotes with straight quotes
-        text = text.replace('"', '"').replace('"', '"')  # Curly double quotes
-        text = text.replace(''', "'").replace(''', "'")  # Curly single quotes
-        text = text.replace('„', '"').replace('"', '"')  # German quotes
-
-        # Replace various dash characters with standard hyphen
-        text = text.replace('–', '-')  # En dash
-        text = text.replace('—', '-')  # Em dash
-        text = text.replace('−', '-')  # Minus sign
-
-        # Replace non-breaking spaces with regular spaces
-        text = text.replace('\u00A0', ' ')  # Non-breaking space
-        text = text.replace('\u202F', ' ')  # Narrow no-break space
-
-        # Normalize multiple spaces to single space
-        import re
-        text = re.sub(r'\s+', ' ', text)
-
-        return text
+        # One translate pass over the input, then collapse runs of spaces
+        return _WS.sub(' ', text.translate(_NORMALIZE_TABLE))
 
     def _extract_date(self, text):
         """Extract date from text."""
         # Check for explicit date formats (DD.MM.YYYY, DD/MM/YYYY, YYYY-MM-DD)
-        date_patterns = [
-            r'(\d{1,2})[./](\d{1,2})[./](\d{4})',  # DD.MM.YYYY or DD/MM/YYYY
-            r'(\d{4})-(\d{1,2})-(\d{1,2})'  # YYYY-MM-DD
-        ]
-
-        for pattern in date_patterns:
-            match = re.search(pattern, text)
-            if match:
-                try:
-                    if '/' in match.group(0) or '.' in match.group(0):
-                        # DD.MM.YYYY or DD/MM/YYYY
-                        day, month, year = match.groups()
-                        return datetime(int(year), int(month), int(day))
-                    else:
-                        # YYYY-MM-DD
-                        year, month, day = match.groups()
-                        return datetime(int(year), int(month), int(day))
-                except ValueError:
-                    pass
-
-        # Check for relative dates
-        if 'today' in text:
-            return self.today
-        elif 'tomorrow' in text:
-            return self.today + timedelta(days=1)
-        elif 'next week' in text:
-            return self.today + timedelta(days=7)
-
-        # Check for specific weekday patterns
-        for weekday_name, weekday_num in self.WEEKDAYS.items():
-            if weekday_name in text:
-                days_ahead = weekday_num - self.today.weekday()
-                if days_ahead <= 0:  # Target day already happened this week
-                    if 'next' in text:
-                        days_ahead += 7
-                    else:
-                        days_ahead += 7  # Default to next week
-                return self.today + timedelta(days=days_ahead)
+        match = _DATE_DMY.search(text)
+        if match:
+            day, _, month, year = match.groups()
+            try:
+                return datetime(int(year), int(month), int(day))
+            except ValueError:
+                pass
+
+        match = _DATE_ISO.search(text)
+        if match:
+            year, month, day = match.groups()
+            try:
+                return datetime(int(year), int(month), int(day))
+            except ValueError:
+                pass
+
+        # Relative keywords and weekday names share a single scan; dispatch
+        # on the captured token
+        day_match = _DAY_TOKEN_RE.search(text)
+        if day_match:
+            token = day_match.group(1)
+
+            delta = _RELATIVE_DAYS.get(token)
+            if delta is not None:
+                return self.today + timedelta(days=delta)
+
+            days_ahead = self.WEEKDAYS[token] - self.today.weekday()
+            if days_ahead <= 0:  # Target day already happened this week
+                days_ahead += 7  # Default to next week
+            return self.today + timedelta(days=days_ahead)
 
         # Default to today if no date found
         return self.today
 
     def _extract_time_range(self, text):
         """Extract time range from text."""
-        # Check for "at HH:MM" pattern first (specific single time)
-        at_pattern = r'\bat\s+(\d{1,2}):(\d{2})'
-        at_match = re.search(at_pattern, text)
+        # Check for "at HH:MM" first (specific single time) so it keeps
+        # priority over range-looking text anywhere else in the input
+        at_match = _AT_TIME.search(text)
         if at_match:
-            hour = int(at_match.group(1))
-            minute = at_match.group(2)
-            start = f"{hour:02d}:{minute}"
-            # For "at X", show X to X+1 hour
-            end_hour = (hour + 1) % 24
-            end = f"{end_hour:02d}:{minute}"
-            return (start, end)
-
-        # Pattern for time ranges like "6-8pm", "15:00-18:00", "6pm-8pm"
-        time_patterns = [
-            # HH:MM-HH:MM (24-hour format)
-            r'(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})',
-            # H-H with optional pm/am
-            r'(\d{1,2})\s*-\s*(\d{1,2})\s*(pm|am)?',
-            # H:MM pm/am - H:MM pm/am
-            r'(\d{1,2}):(\d{2})\s*(pm|am)?\s*-\s*(\d{1,2}):(\d{2})\s*(pm|am)?'
-        ]
-
-        for pattern in time_patterns:
-            match = re.search(pattern, text)
-            if match:
-                groups = match.groups()
-
-                # Handle different formats
-                if ':' in match.group(0):
-                    # HH:MM format
-                    if len(groups) == 4 and groups[2] and groups[3]:
-                        # HH:MM-HH:MM
-                        start_hour, start_min, end_hour, end_min = groups
-                        return (
-                            f"{int(start_hour):02d}:{int(start_min):02d}",
-                            f"{int(end_hour):02d}:{int(end_min):02d}"
-                        )
-                    elif len(groups) >= 6:
-                        # H:MM am/pm - H:MM am/pm
-                        start_hour = int(groups[0])
-                        start_min = groups[1]
-                        start_period = groups[2]
-                        end_hour = int(groups[3])
-                        end_min = groups[4]
-                        end_period = groups[5]
-
-                        if start_period == 'pm' and start_hour != 12:
-                            start_hour += 12
-                        if end_period == 'pm' and end_hour != 12:
-                            end_hour += 12
-
-                        return (
-                            f"{start_hour:02d}:{start_min}",
-                            f"{end_hour:02d}:{end_min}"
-                        )
-                else:
-                    # Simple H-H format
-                    start_hour = int(groups[0])
-                    end_hour = int(groups[1])
-                    period = groups[2] if len(groups) > 2 else None
-
-                    if period == 'pm':
-                        if start_hour != 12:
-                            start_hour += 12
-                        if end_hour != 12:
-                            end_hour += 12
-
-                    return (
-                        f"{start_hour:02d}:00",
-                        f"{end_hour:02d}:00"
-                    )
-
-        # Check for "between X and Y" pattern
-        between_match = re.search(r'between\s+(\d{1,2}):?(\d{2})?\s+and\s+(\d{1,2}):?(\d{2})?', text)
-        if between_match:
-            groups = between_match.groups()
-            start_hour = int(groups[0])
-            start_min = groups[1] if groups[1] else "00"
-            end_hour = int(groups[2])
-            end_min = groups[3] if groups[3] else "00"
+            # "at HH:MM" - show X to X+1 hour; only the end hour needs
+            # arithmetic, the start is zero-padded as-is
+            minute = at_match['at_m']
+            end_hour = (int(at_match['at_h']) + 1) % 24
+            return (f"{at_match['at_h'].zfill(2)}:{minute}", f"{end_hour:02d}:{minute}")
+
+        match = _TIME_RANGE_RE.search(text)
+        if not match:
+            # Default time range (9am - 9pm)
+            return ("09:00", "21:00")
+
+        if match['r1_sh']:
+            # HH:MM-HH:MM (24-hour format) - minutes come from \d{2}, so
+            # only the hours may need a leading zero; no int round-trip
+            return (
+                f"{match['r1_sh'].zfill(2)}:{match['r1_sm']}",
+                f"{match['r1_eh'].zfill(2)}:{match['r1_em']}"
+            )
+
+        if match['r2_sh']:
+            # Simple H-H format with optional pm/am
+            start_hour = int(match['r2_sh'])
+            end_hour = int(match['r2_eh'])
+
+            if match['r2_p'] == 'pm':
+                if start_hour != 12:
+                    start_hour += 12
+                if end_hour != 12:
+                    end_hour += 12
+
+            return (f"{start_hour:02d}:00", f"{end_hour:02d}:00")
+
+        if match['r3_sh']:
+            # H:MM am/pm - H:MM am/pm
+            start_hour = int(match['r3_sh'])
+            end_hour = int(match['r3_eh'])
+
+            if match['r3_sp'] == 'pm' and start_hour != 12:
+                start_hour += 12
+            if match['r3_ep'] == 'pm' and end_hour != 12:
+                end_hour += 12
 
             return (
-                f"{start_hour:02d}:{start_min}",
-                f"{end_hour:02d}:{end_min}"
+                f"{start_hour:02d}:{match['r3_sm']}",
+                f"{end_hour:02d}:{match['r3_em']}"
             )
 
-        # Default time range (9am - 9pm)
-        return ("09:00", "21:00")
+        # "between X and Y"
+        return (
+            f"{match['b_sh'].zfill(2)}:{match['b_sm'] or '00'}",
+            f"{match['b_eh'].zfill(2)}:{match['b_em'] or '00'}"
+        )
 
     def format_datetime(self, date_obj, time_str):
         """Combine date and time into a datetime object."""
-        hour, minute = map(int, time_str.split(':'))
+        hour, minute = _parse_hm(time_str)
         return date_obj.replace(hour=hour, minute=minute, second=0, microsecond=0)
 
 
+@functools.lru_cache(maxsize=128)
+def _parse_hm(time_str):
+    """Split an HH:MM string into (hour, minute) ints.
+
+    Slot listings reuse the same handful of time strings, so the split
+    and int parses are cached.
+    """
+    hour, minute = time_str.split(':', 1)
+    return int(hour), int(minute)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_core(text, today_ordinal):
+    """Run date and time extraction for normalized text on a given day.
+
+    Keyed on the day ordinal as well as the text so cached entries expire
+    naturally at midnight, when relative dates shift.
+    """
+    parser = TimeframeParser(now=datetime.fromordinal(today_ordinal))
+    date_obj = parser._extract_date(text)
+    start_time, end_time = parser._extract_time_range(text)
+    return date_obj.toordinal(), start_time, end_time
+
+
+# Relative-date keywords mapped to day offsets from today
+_RELATIVE_DAYS = {'today': 0, 'tomorrow': 1, 'next week': 7}
+
+# One alternation over the relative keywords and all weekday tokens instead
+# of 17 substring scans per parse; longest-first ordering makes 'tuesday'
+# win over 'tue', and the word boundaries stop 'sun' matching inside words
+# like 'sunny'
+_DAY_TOKEN_RE = re.compile(
+    r'\b(' + '|'.join(
+        sorted([*_RELATIVE_DAYS, *TimeframeParser.WEEKDAYS], key=len, reverse=True)
+    ) + r')\b')
+
+
 if __name__ == "__main__":
     # Test the parser
     parser = TimeframeParser()
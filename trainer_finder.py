@@ -1,11 +1,79 @@
 """Trainer finder module for Das Spiel tennis center."""
 
+import functools
+import html
 import json
+import logging
 import os
+import re
 import requests
+import threading
+import time
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 
+logger = logging.getLogger(__name__)
+
+# Optional C-accelerated decoder for the booking-data and calendar
+# payloads, with the stdlib as fallback - same pattern as scrapers_v2
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+_CREDENTIALS_FILE = 'credentials.json'
+
+# Each page is fetched for exactly one meta tag, so scan for it directly
+# instead of building a full BeautifulSoup tree - same approach as
+# verify_booking.py. Bytes patterns run on response.content with no decode
+# of the rest of the page.
+_CSRF_META_RE = re.compile(rb'<meta[^>]+name="csrf-token"[^>]+content="([^"]+)"')
+_CALENDAR_META_RE = re.compile(rb'<meta[^>]+id="transfer-data-calendar"[^>]+data-content="([^"]+)"')
+
+# Pace booking-data probes to ~10 per second across all worker threads -
+# polite to the server without serializing the requests behind a fixed
+# per-call sleep
+_MIN_REQUEST_INTERVAL = 0.1
+_throttle_lock = threading.Lock()
+_next_request_at = 0.0
+
+
+def _throttle() -> None:
+    """Block until this thread may start the next booking-data request."""
+    global _next_request_at
+    with _throttle_lock:
+        now = time.monotonic()
+        wait = _next_request_at - now
+        _next_request_at = max(now, _next_request_at) + _MIN_REQUEST_INTERVAL
+    if wait > 0:
+        time.sleep(wait)
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_credentials_file(mtime: float) -> Dict:
+    """Read and parse the credentials file.
+
+    Keyed on the file's mtime, so repeated find_trainers() calls skip the
+    disk read and JSON parse until the file actually changes.
+    """
+    with open(_CREDENTIALS_FILE, 'r') as f:
+        return json.load(f)
+
+
+def _get_credentials() -> Dict:
+    """Return the Das Spiel credentials, or {} if unavailable."""
+    try:
+        mtime = os.stat(_CREDENTIALS_FILE).st_mtime
+    except OSError:
+        return {}
+    try:
+        return _parse_credentials_file(mtime).get('dasspiel', {})
+    except Exception as e:
+        logger.error("Error loading credentials: %s", e)
+        return {}
+
 
 class TrainerFinder:
     """Finds available trainers at Das Spiel tennis center."""
@@ -16,19 +84,17 @@ class TrainerFinder:
     def __init__(self):
         """Initialize trainer finder with session and credentials."""
         self.session = requests.Session()
+        # Keep-alive pool sized for the probe workers, so concurrent
+        # booking-data requests reuse warm connections instead of paying
+        # the TCP+TLS handshake per request
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
         self.credentials = self._load_credentials()
         self.token = None
+        self._court_ids: Optional[List[str]] = None
 
     def _load_credentials(self) -> Dict:
         """Load credentials from credentials.json file."""
-        if os.path.exists('credentials.json'):
-            try:
-                with open('credentials.json', 'r') as f:
-                    data = json.load(f)
-                    return data.get('dasspiel', {})
-            except Exception as e:
-                print(f"Error loading credentials: {e}")
-        return {}
+        return _get_credentials()
 
     def _get_auth_token(self) -> Optional[str]:
         """Authenticate and get auth token."""
@@ -41,10 +107,8 @@ class TrainerFinder:
 
             # Get CSRF token first
             response = self.session.get(signin_url, timeout=10)
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.content, 'html.parser')
-            csrf_meta = soup.find('meta', {'name': 'csrf-token'})
-            csrf_token = csrf_meta['content'] if csrf_meta else None
+            csrf_match = _CSRF_META_RE.search(response.content)
+            csrf_token = csrf_match.group(1).decode('utf-8') if csrf_match else None
 
             # Sign in
             signin_data = {
@@ -82,12 +146,22 @@ class TrainerFinder:
                 print(f"Authentication failed: {response.status_code} - {response.text}")
                 return None
 
-        except Exception as e:
-            print(f"Error during authentication: {e}")
+        except Exception:
+            logger.exception("Error during authentication")
             return None
 
     def _get_court_ids(self) -> List[str]:
-        """Get list of court IDs from Das Spiel."""
+        """Get list of court IDs from Das Spiel, cached per instance.
+
+        The IDs don't change between searches, so fetching and parsing the
+        main page once per TrainerFinder is enough.
+        """
+        if self._court_ids is None:
+            self._court_ids = self._fetch_court_ids()
+        return self._court_ids
+
+    def _fetch_court_ids(self) -> List[str]:
+        """Fetch court IDs from the Das Spiel main page."""
         try:
             # Fetch the main page to get court data
             headers = {
@@ -95,21 +169,18 @@ class TrainerFinder:
             }
             response = self.session.get(self.BASE_URL, headers=headers, timeout=10)
 
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Extract calendar data from meta tag
-            calendar_meta = soup.find('meta', {'id': 'transfer-data-calendar'})
-            if calendar_meta and calendar_meta.get('data-content'):
-                calendar_json = calendar_meta['data-content'].replace('&quot;', '"')
-                calendar_data = json.loads(calendar_json)
+            # Extract calendar data from the meta tag
+            match = _CALENDAR_META_RE.search(response.content)
+            if match:
+                calendar_json = html.unescape(match.group(1).decode('utf-8'))
+                calendar_data = _json_loads(calendar_json)
 
                 # Extract court IDs (UUIDs)
                 court_ids = [court.get('uuid') for court in calendar_data if court.get('uuid')]
                 return court_ids[:5]  # Limit to first 5 courts to avoid overloading
 
-        except Exception as e:
-            print(f"Error getting court IDs: {e}")
+        except Exception:
+            logger.exception("Error getting court IDs")
 
         # Return a default court ID from the example
         return ["3c3895e4-111f-4387-b815-7506ffe26607"]
@@ -138,7 +209,10 @@ class TrainerFinder:
             print("Authentication failed - cannot fetch trainer data")
             return []
 
-        all_trainer_slots = []
+        # Keyed on the dedup tuple as results arrive, so duplicates are
+        # dropped during collection instead of in a second pass over a
+        # list that briefly holds them all
+        unique_slots: Dict = {}
         court_ids = self._get_court_ids()
 
         # Parse start and end times
@@ -148,38 +222,49 @@ class TrainerFinder:
         print(f"\nSearching for trainers on {date.strftime('%Y-%m-%d')} from {start_time} to {end_time}")
         print(f"Checking {len(court_ids)} courts...")
 
-        # To avoid making too many requests, we'll check every 2 hours
-        for hour in range(start_hour, end_hour, 2):
-            time_str = f"{hour:02d}:00"
+        # To avoid making too many requests, we check every 2 hours. The
+        # probes are independent GETs, so run them through a small thread
+        # pool - the bounded worker count keeps the request rate polite
+        # without a fixed sleep between calls, and the wall-clock cost
+        # drops from the sum of the round-trips to roughly a quarter
+        # (requests.Session is thread-safe for concurrent GETs)
+        tasks = [
+            (f"{hour:02d}:00", court_id)
+            for hour in range(start_hour, end_hour, 2)
+            for court_id in court_ids
+        ]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                executor.submit(
+                    self._fetch_trainer_data,
+                    date=date,
+                    time_start=time_str,
+                    court_id=court_id
+                ): (time_str, court_id)
+                for time_str, court_id in tasks
+            }
 
-            for court_id in court_ids:
+            for future in as_completed(futures):
+                time_str, court_id = futures[future]
                 try:
-                    # Add small delay to avoid rate limiting
-                    import time
-                    time.sleep(0.3)
-
-                    trainer_data = self._fetch_trainer_data(
-                        date=date,
-                        time_start=time_str,
-                        court_id=court_id
-                    )
-
-                    if trainer_data:
-                        # Filter by trainer name if specified
-                        if trainer_name:
-                            trainer_data = self._filter_by_trainer_name(trainer_data, trainer_name)
-
-                        all_trainer_slots.extend(trainer_data)
-
+                    trainer_data = future.result()
                 except Exception as e:
-                    print(f"Error fetching trainer data for court {court_id} at {time_str}: {e}")
+                    logger.error("Error fetching trainer data for court %s at %s: %s",
+                                 court_id, time_str, e)
                     continue
 
-        # Remove duplicates based on time_start, time_end, and trainer names
-        unique_slots = self._deduplicate_slots(all_trainer_slots)
+                if trainer_data:
+                    # Filter by trainer name if specified
+                    if trainer_name:
+                        trainer_data = self._filter_by_trainer_name(trainer_data, trainer_name)
 
-        print(f"Found {len(unique_slots)} unique trainer slots")
-        return unique_slots
+                    for slot in trainer_data:
+                        unique_slots.setdefault(self._slot_key(slot), slot)
+
+        results = list(unique_slots.values())
+        print(f"Found {len(results)} unique trainer slots")
+        return results
 
     def _fetch_trainer_data(
         self,
@@ -189,6 +274,8 @@ class TrainerFinder:
     ) -> List[Dict]:
         """Fetch trainer data from the booking API."""
         try:
+            _throttle()
+
             params = {
                 'date': date.strftime('%Y-%m-%d'),
                 'time_start': time_start,
@@ -212,7 +299,9 @@ class TrainerFinder:
             if response.status_code != 200:
                 return []
 
-            data = response.json()
+            # Decode the raw bytes directly rather than going through
+            # response.json(), which always uses the stdlib parser
+            data = _json_loads(response.content)
 
             # Check if request was successful
             if data.get('status') != 1:
@@ -222,26 +311,29 @@ class TrainerFinder:
             trainer_data = booking_data.get('trainer_data', [])
             square_name = booking_data.get('square_name', 'Unknown Court')
 
-            # Process trainer data
-            processed_slots = []
-            for slot in trainer_data:
-                trainers_list = slot.get('trainers', [])
-                if trainers_list:  # Only include if trainers are available
-                    processed_slots.append({
-                        'date': date.strftime('%Y-%m-%d'),
-                        'day_of_week': date.strftime('%A'),
-                        'time_start': slot.get('time_start'),
-                        'time_end': slot.get('time_end'),
-                        'price': slot.get('price'),
-                        'court_name': square_name,
-                        'trainers': trainers_list,
-                        'venue': 'Tenniszentrum Arsenal (Das Spiel)'
-                    })
-
-            return processed_slots
+            # The date strings are constant across the batch - two strftime
+            # calls total instead of two per slot. Only slots that actually
+            # have trainers are kept.
+            date_str = date.strftime('%Y-%m-%d')
+            day_of_week = date.strftime('%A')
+
+            return [
+                {
+                    'date': date_str,
+                    'day_of_week': day_of_week,
+                    'time_start': slot.get('time_start'),
+                    'time_end': slot.get('time_end'),
+                    'price': slot.get('price'),
+                    'court_name': square_name,
+                    'trainers': trainers_list,
+                    'venue': 'Tenniszentrum Arsenal (Das Spiel)'
+                }
+                for slot in trainer_data
+                if (trainers_list := slot.get('trainers'))
+            ]
 
         except Exception as e:
-            print(f"Error in _fetch_trainer_data: {e}")
+            logger.error("Error in _fetch_trainer_data: %s", e)
             return []
 
     def _filter_by_trainer_name(self, trainer_slots: List[Dict], trainer_name: str) -> List[Dict]:
@@ -250,38 +342,45 @@ class TrainerFinder:
         trainer_name_lower = trainer_name.lower()
 
         for slot in trainer_slots:
-            # Filter trainers list
-            matching_trainers = [
-                t for t in slot.get('trainers', [])
+            trainers = slot.get('trainers', ())
+
+            # Most slots won't contain the requested name - any() stops at
+            # the first hit, and non-matching slots skip the list build and
+            # dict copy entirely
+            if not any(trainer_name_lower in t.get('name', '').lower() for t in trainers):
+                continue
+
+            # Create new slot with filtered trainers
+            filtered_slot = slot.copy()
+            filtered_slot['trainers'] = [
+                t for t in trainers
                 if trainer_name_lower in t.get('name', '').lower()
             ]
-
-            if matching_trainers:
-                # Create new slot with filtered trainers
-                filtered_slot = slot.copy()
-                filtered_slot['trainers'] = matching_trainers
-                filtered_slots.append(filtered_slot)
+            filtered_slots.append(filtered_slot)
 
         return filtered_slots
 
+    @staticmethod
+    def _slot_key(slot: Dict) -> tuple:
+        """Dedup key: the time window plus the set of trainer names.
+
+        frozenset is order-insensitive without sorting the names per slot.
+        """
+        return (
+            slot['time_start'],
+            slot['time_end'],
+            frozenset(t['name'] for t in slot.get('trainers', ()))
+        )
+
     def _deduplicate_slots(self, slots: List[Dict]) -> List[Dict]:
         """Remove duplicate trainer slots."""
-        seen = set()
-        unique_slots = []
+        # The dict keeps first-seen order, replacing a separate seen set
+        unique_slots: Dict = {}
 
         for slot in slots:
-            # Create a unique key based on time window
-            key = (
-                slot['time_start'],
-                slot['time_end'],
-                tuple(sorted([t['name'] for t in slot.get('trainers', [])]))
-            )
-
-            if key not in seen:
-                seen.add(key)
-                unique_slots.append(slot)
+            unique_slots.setdefault(self._slot_key(slot), slot)
 
-        return unique_slots
+        return list(unique_slots.values())
 
 
 def find_trainers(date: datetime, start_time: str, end_time: str, trainer_name: Optional[str] = None) -> List[Dict]:
@@ -11,6 +11,11 @@ if __name__ == '__main__':
     import json
     import re
 
+    try:
+        from orjson import loads as json_loads
+    except ImportError:
+        json_loads = json.loads
+
     print("=" * 70)
     print("VERIFICATION: Checking calendar for booking on 2026-01-21")
     print("=" * 70)
@@ -44,40 +49,45 @@ if __name__ == '__main__':
         sys.exit(1)
 
     calendar_json = match.group(1).replace('&quot;', '"')
-    calendar_data = json.loads(calendar_json)
+    calendar_data = json_loads(calendar_json)
 
-    # Find Platz 5 and check its rentals
-    for court in calendar_data:
-        court_name = court.get('name', 'Unknown')
+    # Find Platz 5 - stop at the first match instead of walking every court
+    court = next(
+        (c for c in calendar_data if 'PLATZ 5' in c.get('name', '').upper()),
+        None
+    )
 
-        if 'Platz 5' in court_name or 'PLATZ 5' in court_name.upper():
-            print(f"\nFound: {court_name}")
-            rentals = court.get('rentals', [])
-
-            print(f"Total rentals on this court: {len(rentals)}")
-
-            if rentals:
-                print("\nRentals:")
-                for rental in rentals:
-                    time_start = rental.get('time_start', 'Unknown')
-                    time_end = rental.get('time_end', 'Unknown')
-                    is_own = rental.get('is_own_booking', False)
-                    print(f"  {time_start} - {time_end} {'(YOUR BOOKING)' if is_own else ''}")
-
-                # Check for 10:00 booking
-                for rental in rentals:
-                    if rental.get('time_start', '').startswith('10:00'):
-                        print("\n" + "=" * 70)
-                        print("✓ BOOKING CONFIRMED!")
-                        print(f"Your booking is visible on the calendar:")
-                        print(f"  Court: {court_name}")
-                        print(f"  Time: {rental.get('time_start')} - {rental.get('time_end')}")
-                        print(f"  Is your booking: {rental.get('is_own_booking', False)}")
-                        print("=" * 70)
-                        sys.exit(0)
-            else:
-                print("No rentals found on Platz 5")
-                break
+    if court:
+        court_name = court.get('name', 'Unknown')
+        print(f"\nFound: {court_name}")
+        rentals = court.get('rentals', [])
+
+        print(f"Total rentals on this court: {len(rentals)}")
+
+        if rentals:
+            # One pass: print each rental and remember the 10:00 booking
+            booked = None
+            print("\nRentals:")
+            for rental in rentals:
+                time_start = rental.get('time_start', 'Unknown')
+                time_end = rental.get('time_end', 'Unknown')
+                is_own = rental.get('is_own_booking', False)
+                print(f"  {time_start} - {time_end} {'(YOUR BOOKING)' if is_own else ''}")
+
+                if booked is None and time_start.startswith('10:00'):
+                    booked = rental
+
+            if booked:
+                print("\n" + "=" * 70)
+                print("✓ BOOKING CONFIRMED!")
+                print(f"Your booking is visible on the calendar:")
+                print(f"  Court: {court_name}")
+                print(f"  Time: {booked.get('time_start')} - {booked.get('time_end')}")
+                print(f"  Is your booking: {booked.get('is_own_booking', False)}")
+                print("=" * 70)
+                sys.exit(0)
+        else:
+            print("No rentals found on Platz 5")
 
     print("\nWARNING: Could not find the 10:00 booking in the calendar.")
     print("This might be a delay in the system updating.")